@@ -1,75 +1,27 @@
+import os
+import sys
 import time
 import tracemalloc
-from copy import deepcopy
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from satcore import dp
+from satcore.literals import decode_assignments, encode_formula
+
 def negate_literal(lit):
     return lit[1:] if lit.startswith("-") else "-" + lit
 
 def get_variable(lit):
     return lit[1:] if lit.startswith("-") else lit
 
-def unit_prop(formula, assignments):
-    formula = {frozenset(cl) for cl in formula}
-    made_change = True
-    while made_change:
-        made_change = False
-        unit = None
-        for clause in formula:
-            if len(clause) == 1:
-                unit = next(iter(clause))
-                break
-        if unit:
-            made_change = True
-            var = get_variable(unit)
-            assignments[var] = not unit.startswith("-")
-            neg_unit = negate_literal(unit)
-            new_formula = set()
-            for clause in formula:
-                if unit in clause:
-                    continue
-                new_clause = clause - {neg_unit}
-                if not new_clause:
-                    return {frozenset()}, assignments
-                new_formula.add(new_clause)
-            formula = new_formula
-            if not formula:
-                break
-    return formula, assignments
-
-def resolve(formula, var):
-    pos_clauses = {cl for cl in formula if var in cl}
-    neg_clauses = {cl for cl in formula if negate_literal(var) in cl}
-    other_clauses = {cl for cl in formula if var not in cl and negate_literal(var) not in cl}
-    new_formula_from_resolution = set()
-    for p_clause in pos_clauses:
-        for n_clause in neg_clauses:
-            resolvent = (p_clause - {var}) | (n_clause - {negate_literal(var)})
-            is_tautology_direct = any(negate_literal(l) in resolvent for l in resolvent)
-            if not is_tautology_direct:
-                new_formula_from_resolution.add(frozenset(resolvent))
-    return new_formula_from_resolution | other_clauses
-
 def solve_sat(formula, assignments=None):
-    if assignments is None:
-        assignments = {}
-    current_formula = {frozenset(cl) for cl in formula}
-    current_assignments = assignments
-    current_formula, current_assignments = unit_prop(current_formula, current_assignments)
-    if not current_formula:
-        return True, current_assignments
-    if any(not cl for cl in current_formula):
+    clauses, names = encode_formula(formula)
+    satisfiable, int_assignments = dp.solve_sat(clauses)
+    if not satisfiable:
         return False, {}
-    var_to_resolve = None
-    for cl in current_formula:
-        if cl:
-            first_literal = next(iter(cl), None)
-            if first_literal:
-                var_to_resolve = get_variable(first_literal)
-                break
-    if not var_to_resolve:
-        return True, current_assignments
-    return solve_sat(resolve(current_formula, var_to_resolve), current_assignments)
+    result = {} if assignments is None else assignments
+    result.update(decode_assignments(int_assignments, names))
+    return True, result
 
 def generate_formula_param(num_base_clauses):
     formula = []
@@ -99,11 +51,11 @@ def benchmark():
         actual_variables = len({get_variable(lit) for lit in all_literals_current})
         print(f"Formula generated: {actual_clauses} actual clauses, {actual_variables} variables.")
         print(f"Running solver {SOLVER_ITERATIONS_PER_FORMULA} time(s) for this formula...")
+        clauses, _ = encode_formula(current_formula)
         tracemalloc.start()
         cpu0 = time.process_time()
         for i in range(SOLVER_ITERATIONS_PER_FORMULA):
-            formula_to_solve = deepcopy(current_formula)
-            satisfiable, _ = solve_sat(formula_to_solve)
+            satisfiable, _ = dp.solve_sat(clauses)
             if i == 0:
                 print(f"  Result: Satisfiable = {satisfiable}")
         cpu1 = time.process_time()
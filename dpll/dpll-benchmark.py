@@ -1,47 +1,25 @@
-import time
-import tracemalloc
-from copy import deepcopy
 import os
-import glob
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from satcore import dpll
+from satcore.benchmark import benchmark_file, benchmark_parallel, describe_row, find_cnf_files
+from satcore.dimacs import parse_dimacs
+from satcore.heuristics import HEURISTICS
+from satcore.limits import limits_supported
+from satcore.literals import decode_assignments, encode_formula
+from satcore.restarts import RESTART_POLICIES
+from satcore.solvers import HEURISTIC_SOLVERS, RESTART_SOLVERS, SIMPLIFY_SOLVERS, SOLVERS
+
 def negate_literal(lit):
     return lit[1:] if lit.startswith("-") else "-" + lit
 
 def get_variable(lit):
     return lit[1:] if lit.startswith("-") else lit
 
-def unit_prop(formula, assignments):
-    current_formula = {frozenset(cl) for cl in formula}
-    made_change = True
-    while made_change:
-        made_change = False
-        unit_literal = None
-        for clause in current_formula:
-            if len(clause) == 1:
-                unit_literal = next(iter(clause))
-                break
-        if unit_literal:
-            made_change = True
-            var = get_variable(unit_literal)
-            assignments[var] = not unit_literal.startswith("-")
-            negated_unit = negate_literal(unit_literal)
-            new_formula_temp = set()
-            for cl in current_formula:
-                if unit_literal in cl:
-                    continue
-                if negated_unit in cl:
-                    new_clause = cl - {negated_unit}
-                    if not new_clause:
-                        return {frozenset()}, assignments
-                    new_formula_temp.add(new_clause)
-                else:
-                    new_formula_temp.add(cl)
-            current_formula = new_formula_temp
-    return current_formula, assignments
-
 def get_most_frequent_variable(formula):
     counts = {}
     for clause in formula:
@@ -53,139 +31,49 @@ def get_most_frequent_variable(formula):
     return max(counts, key=counts.get)
 
 def solve_sat(formula_orig, assignments_orig=None):
-    formula = {frozenset(cl) for cl in formula_orig}
-    assignments = {} if assignments_orig is None else deepcopy(assignments_orig)
-    formula, assignments = unit_prop(formula, assignments)
-    if not formula:
-        return True, assignments
-    if any(not cl for cl in formula):
+    clauses, names = encode_formula(formula_orig)
+    satisfiable, int_assignments = dpll.solve_sat(clauses)
+    if not satisfiable:
         return False, {}
-    var_to_branch = None
-    min_clause_len = float('inf')
-    for cl in formula:
-        if cl:
-            if len(cl) < min_clause_len:
-                min_clause_len = len(cl)
-                var_to_branch = get_variable(next(iter(cl)))
-    if not var_to_branch:
-        return True, assignments
-    formula_true = deepcopy(formula)
-    formula_true.add(frozenset({var_to_branch}))
-    res_true, assign_true = solve_sat(formula_true, deepcopy(assignments))
-    if res_true:
-        final_assignments = assignments.copy()
-        final_assignments.update(assign_true)
-        final_assignments[var_to_branch] = True
-        return True, final_assignments
-    formula_false = deepcopy(formula)
-    formula_false.add(frozenset({negate_literal(var_to_branch)}))
-    res_false, assign_false = solve_sat(formula_false, deepcopy(assignments))
-    if res_false:
-        final_assignments = assignments.copy()
-        final_assignments.update(assign_false)
-        final_assignments[var_to_branch] = False
-        return True, final_assignments
-    return False, {}
+    assignments = {} if assignments_orig is None else dict(assignments_orig)
+    assignments.update(decode_assignments(int_assignments, names))
+    return True, assignments
 
 def parse_cnf_content(cnf_string):
-    formula_set = set()
-    num_vars_problem = 0
-    num_clauses_problem = 0
-    max_var_index = 0
-    lines = cnf_string.splitlines()
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('c') or line.startswith('%'):
-            continue
-        if line.startswith('p cnf'):
-            parts = line.split()
-            try:
-                num_vars_problem = int(parts[2])
-                num_clauses_problem = int(parts[3])
-            except (IndexError, ValueError):
-                pass
-            continue
-        parts = line.split()
-        current_clause_literals = []
-        for part_str in parts:
-            if part_str == '0':
-                break
-            try:
-                literal_val = int(part_str)
-                var_index = abs(literal_val)
-                max_var_index = max(max_var_index, var_index)
-                variable_name = f"x{var_index}"
-                if literal_val < 0:
-                    current_clause_literals.append(f"-{variable_name}")
-                else:
-                    current_clause_literals.append(variable_name)
-            except ValueError:
-                continue
-        if current_clause_literals:
-            formula_set.add(frozenset(current_clause_literals))
-    formula = [set(cl) for cl in formula_set]
-    if num_vars_problem == 0 and max_var_index > 0:
-        num_vars_problem = max_var_index
-    return formula, num_vars_problem, len(formula)
+    clauses, num_vars, num_clauses = parse_dimacs(cnf_string.splitlines(), check_header=False)
+    formula = [{f"x{lit}" if lit > 0 else f"-x{-lit}" for lit in clause} for clause in clauses]
+    return formula, num_vars, num_clauses
 
-def run_benchmark(cnf_dir_path):
-    benchmark_results = []
-    cnf_files = glob.glob(os.path.join(cnf_dir_path, '**', '*.cnf'), recursive=True)
+def run_benchmark(cnf_dir_path, solver="dpll", heuristic=None, restarts=None, formula_cache=None, workers=1,
+                  time_limit=None, cpu_limit=None, memory_limit=None, simplify=None):
+    """
+    formula_cache: None parses every file; True keeps a binary cache file next
+    to each CNF and a directory path keeps them all there, keyed by content hash.
+    workers > 1 solves that many files at a time, each in a process of its own,
+    so a worker that dies only costs its own file a Crash row; rows are printed
+    as files finish and returned in file order either way.
+    time_limit and cpu_limit (seconds) and memory_limit (MB) apply to each
+    file; a file over its limit gets a TIMEOUT or MEMOUT row.
+    simplify fixes pure and failed literals in the solvers that support it.
+    """
+    cnf_files = find_cnf_files(cnf_dir_path)
     if not cnf_files:
         print(f"No .cnf files found in directory: {cnf_dir_path}")
         return pd.DataFrame()
     print(f"Found {len(cnf_files)} CNF files to process.")
-    for i, cnf_file_path in enumerate(cnf_files):
-        print(f"\nProcessing file {i+1}/{len(cnf_files)}: {os.path.basename(cnf_file_path)} ...")
-        try:
-            with open(cnf_file_path, 'r') as f:
-                cnf_content_str = f.read()
-        except Exception as e:
-            print(f"  Error reading file: {e}")
-            benchmark_results.append({
-                'File': os.path.basename(cnf_file_path),
-                'Result': 'Read Error',
-                'Time (s)': 0,
-                'CPU Time (s)': 0,
-                'Peak Memory (KB)': 0,
-                'Variables': 0,
-                'Clauses': 0,
-                'Error': str(e)
-            })
-            continue
-        formula, num_vars, num_clauses = parse_cnf_content(cnf_content_str)
-        if not formula:
-            print("  No clauses parsed. Skipping.")
-            benchmark_results.append({
-                'File': os.path.basename(cnf_file_path),
-                'Result': 'Parse Error',
-                'Time (s)': 0,
-                'CPU Time (s)': 0,
-                'Peak Memory (KB)': 0,
-                'Variables': num_vars,
-                'Clauses': num_clauses,
-                'Error': 'No clauses parsed'
-            })
-            continue
-        tracemalloc.start()
-        t0 = time.perf_counter()
-        cpu0 = time.process_time()
-        satisfiable, assignments = solve_sat(deepcopy(formula))
-        cpu1 = time.process_time()
-        t1 = time.perf_counter()
-        current_mem, peak_mem = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-        benchmark_results.append({
-            'File': os.path.basename(cnf_file_path),
-            'Result': 'SAT' if satisfiable else 'UNSAT',
-            'Time (s)': t1 - t0,
-            'CPU Time (s)': cpu1 - cpu0,
-            'Peak Memory (KB)': peak_mem / 1024,
-            'Variables': num_vars,
-            'Clauses': num_clauses,
-            'Error': None
-        })
-        print(f"  Result: {'SAT' if satisfiable else 'UNSAT'}, Time: {t1 - t0:.4f}s, Mem: {peak_mem / 1024:.2f}KB")
+    options = (solver, heuristic, restarts, formula_cache, time_limit, cpu_limit, memory_limit, simplify)
+    benchmark_results = [None] * len(cnf_files)
+    if workers <= 1:
+        for i, cnf_file_path in enumerate(cnf_files):
+            print(f"\nProcessing file {i+1}/{len(cnf_files)}: {os.path.basename(cnf_file_path)} ...")
+            benchmark_results[i] = benchmark_file(cnf_file_path, *options)
+            print(describe_row(benchmark_results[i]))
+        return pd.DataFrame(benchmark_results)
+    print(f"Solving with {workers} worker processes.")
+    for done, (i, row) in enumerate(benchmark_parallel(cnf_files, workers, *options), 1):
+        benchmark_results[i] = row
+        print(f"\nFinished file {done}/{len(cnf_files)}: {os.path.basename(cnf_files[i])}")
+        print(describe_row(row))
     return pd.DataFrame(benchmark_results)
 
 def visualize_benchmarks(df):
@@ -193,9 +81,15 @@ def visualize_benchmarks(df):
         print("No benchmark data to visualize.")
         return
     print("\n\n--- Benchmark Summary ---")
-    print(df[['Time (s)', 'CPU Time (s)', 'Peak Memory (KB)', 'Variables', 'Clauses']].describe())
+    print(df[['Time (s)', 'CPU Time (s)', 'Peak Memory (KB)', 'Variables', 'Clauses', 'Decisions', 'Conflicts', 'Restarts', 'Learned Clauses', 'Kept Clauses', 'Fixed Literals']].describe())
     print("\n--- Result Counts ---")
     print(df['Result'].value_counts())
+    print("\n--- Model Checks (SAT results) ---")
+    print(df.loc[df['Result'] == 'SAT', 'Verified'].value_counts(dropna=False))
+    print("\n--- Time by Phase (s) ---")
+    print(df[['Propagation Time (s)', 'Branching Time (s)', 'Analysis Time (s)', 'Resolution Time (s)']].sum())
+    if df['PAR-2 (s)'].notna().any():
+        print(f"\nPAR-2 score: {df['PAR-2 (s)'].sum():.4f}s total, {df['PAR-2 (s)'].mean():.4f}s per file")
     sns.set_theme(style="whitegrid")
     df_sorted_time = df[df['Result'].isin(['SAT', 'UNSAT'])].sort_values(by='Time (s)', ascending=False)
     plt.figure(figsize=(15, 8))
@@ -250,7 +144,38 @@ def main():
     if not os.path.isdir(cnf_directory):
         print(f"Error: Directory '{cnf_directory}' not found.")
         return
-    benchmark_data = run_benchmark(cnf_directory)
+    solver = input(f"Enter the solver to use ({', '.join(SOLVERS)}) [dpll]: ").strip() or "dpll"
+    if solver not in SOLVERS:
+        print(f"Error: Unknown solver '{solver}'.")
+        return
+    heuristic = None
+    if solver in HEURISTIC_SOLVERS:
+        heuristic = input(f"Enter the decision heuristic ({', '.join(HEURISTICS)}) [vsids]: ").strip() or "vsids"
+        if heuristic not in HEURISTICS:
+            print(f"Error: Unknown heuristic '{heuristic}'.")
+            return
+    restarts = None
+    if solver in RESTART_SOLVERS:
+        restarts = input(f"Enter the restart policy ({', '.join(RESTART_POLICIES)}) [luby]: ").strip() or "luby"
+        if restarts not in RESTART_POLICIES:
+            print(f"Error: Unknown restart policy '{restarts}'.")
+            return
+    simplify = None
+    if solver in SIMPLIFY_SOLVERS:
+        simplify = input("Fix pure and failed literals before branching? [y/N]: ").strip().lower() == "y"
+    formula_cache = input("Enter a directory for the binary formula cache (blank to parse every file): ").strip() or None
+    workers = input(f"Enter the number of worker processes [1, this machine has {os.cpu_count()} CPUs]: ").strip()
+    workers = int(workers) if workers.isdigit() else 1
+    time_limit = cpu_limit = memory_limit = None
+    if limits_supported():
+        time_limit = input("Enter a per-file wall-clock limit in seconds (blank for none): ").strip()
+        time_limit = float(time_limit) if time_limit else None
+        cpu_limit = input("Enter a per-file CPU time limit in seconds (blank for none): ").strip()
+        cpu_limit = float(cpu_limit) if cpu_limit else None
+        memory_limit = input("Enter a per-file memory limit in MB (blank for none): ").strip()
+        memory_limit = int(memory_limit) if memory_limit else None
+    benchmark_data = run_benchmark(cnf_directory, solver, heuristic, restarts, formula_cache, workers,
+                                   time_limit, cpu_limit, memory_limit, simplify)
     if not benchmark_data.empty:
         visualize_benchmarks(benchmark_data)
     else:
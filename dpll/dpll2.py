@@ -1,6 +1,11 @@
+import os
+import sys
 import time
 import tracemalloc
-from copy import deepcopy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from satcore import dp
+from satcore.literals import decode_assignments, encode_formula
 
 def negate_literal(lit):
     return lit[1:] if lit.startswith("-") else "-" + lit
@@ -8,54 +13,14 @@ def negate_literal(lit):
 def get_variable(lit):
     return lit[1:] if lit.startswith("-") else lit
 
-def unit_prop(formula, assignments):
-    formula = {frozenset(cl) for cl in formula}
-    made_change = True
-    while made_change:
-        made_change = False
-        unit = None
-        for clause in formula:
-            if len(clause) == 1:
-                unit = next(iter(clause))
-                break
-        if unit:
-            made_change = True
-            var = get_variable(unit)
-            assignments[var] = not unit.startswith("-")
-            neg_unit = negate_literal(unit)
-            new_formula = set()
-            for clause in formula:
-                if unit in clause:
-                    continue
-                new_clause = clause - {neg_unit}
-                if not new_clause:
-                    return {frozenset()}, assignments
-                new_formula.add(new_clause)
-            formula = new_formula
-    return formula, assignments
-
-def resolve(formula, var):
-    pos = {cl for cl in formula if var in cl}
-    neg = {cl for cl in formula if negate_literal(var) in cl}
-    other = {cl for cl in formula if var not in cl and negate_literal(var) not in cl}
-    new_formula = set()
-    for p in pos:
-        for n in neg:
-            res = (p - {var}) | (n - {negate_literal(var)})
-            if not any(negate_literal(l) in res for l in res):
-                new_formula.add(res)
-    return new_formula | other
-
 def solve_sat(formula, assignments=None):
-    if assignments is None:
-        assignments = {}
-    formula, assignments = unit_prop(formula, assignments)
-    if not formula:
-        return True, assignments
-    if any(len(clause) == 0 for clause in formula):
+    clauses, names = encode_formula(formula)
+    satisfiable, int_assignments = dp.solve_sat(clauses)
+    if not satisfiable:
         return False, {}
-    var = get_variable(next(iter(next(iter(formula)))))
-    return solve_sat(resolve(formula, var), assignments)
+    result = {} if assignments is None else assignments
+    result.update(decode_assignments(int_assignments, names))
+    return True, result
 
 def generate_large_formula():
     formula = []
@@ -65,7 +30,7 @@ def generate_large_formula():
     return [set(clause) for clause in formula]
 
 def main():
-    formula = generate_large_formula()
+    clauses, _ = encode_formula(generate_large_formula())
     iterations = 15000
     print(f"Running solver {iterations} times...\n")
 
@@ -74,7 +39,7 @@ def main():
     cpu0 = time.process_time()
 
     for _ in range(iterations):
-        solve_sat(formula)
+        dp.solve_sat(clauses)
 
     cpu1 = time.process_time()
     t1 = time.perf_counter()
@@ -1,6 +1,11 @@
+import os
+import sys
 import time
 import tracemalloc
-import itertools
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from satcore import resolution
+from satcore.literals import encode_formula
 
 
 def negate_literal(literal):
@@ -11,49 +16,13 @@ def get_variable(literal):
     """Gets the variable name from a literal (removes '-' if present)."""
     return literal[1:] if literal.startswith("-") else literal
 
-def resolve_pair(clause1, clause2):
-    """
-    Attempts to resolve two clauses.
-    Returns a set of resolvent clauses (as frozensets).
-    """
-    resolvents = set()
-    for lit in clause1:
-        neg_lit = negate_literal(lit)
-        if neg_lit in clause2:
-            new_clause = (clause1 - {lit}) | (clause2 - {neg_lit})
-            if not any(negate_literal(x) in new_clause for x in new_clause):
-                resolvents.add(frozenset(new_clause))
-    return resolvents
-
 def solve_resolution(initial_formula):
     """
     Performs resolution to check if formula is satisfiable.
     Returns False if unsatisfiable (empty clause derived), True otherwise.
     """
-    if not initial_formula:
-        return True
-
-    clauses = {frozenset(c) for c in initial_formula}
-
-    if frozenset() in clauses:
-        return False
-
-    while True:
-        new_clauses = set()
-        clause_list = list(clauses)
-        for i in range(len(clause_list)):
-            for j in range(i + 1, len(clause_list)):
-                c1 = clause_list[i]
-                c2 = clause_list[j]
-                resolvents = resolve_pair(c1, c2)
-                for r in resolvents:
-                    if not r:
-                        return False  
-                    if r not in clauses:
-                        new_clauses.add(r)
-        if not new_clauses:
-            return True  
-        clauses.update(new_clauses)
+    clauses, _ = encode_formula(initial_formula)
+    return resolution.solve_resolution(clauses)
 
 
 def generate_large_formula():
@@ -67,6 +36,7 @@ def generate_large_formula():
 
 def main():
     formula = generate_large_formula()
+    clauses, _ = encode_formula(formula)
     iterations = 5
     print(f"Running Resolution SAT solver {iterations} times...\n")
 
@@ -75,7 +45,7 @@ def main():
     cpu0 = time.process_time()
 
     for _ in range(iterations):
-        solve_resolution(formula)
+        resolution.solve_resolution(clauses)
 
     cpu1 = time.process_time()
     t1 = time.perf_counter()
@@ -0,0 +1 @@
+"""Shared integer-literal core used by the DP, DPLL and resolution scripts."""
@@ -0,0 +1,207 @@
+"""
+Per-file measurement behind run_benchmark.
+
+benchmark_file() parses and solves one CNF file and returns its result row.
+It only takes picklable arguments and uses no shared state, so the serial
+runner and benchmark_parallel(), which runs every file in a process of its
+own, produce the same rows. SAT models are
+checked against the formula after the measurements are taken. Solves that hit a
+time or memory limit become TIMEOUT or MEMOUT rows and solver exceptions become
+Crash rows, so one bad file never stops the run. The PAR-2 column charges
+par2_penalty(), twice the time limit, for every row that is not an error-free
+SAT or UNSAT answer: UNKNOWN, limit, crash and parse or read error rows alike.
+"""
+import glob
+import multiprocessing
+import os
+import time
+import tracemalloc
+from multiprocessing.connection import wait
+
+from .dimacs import CNF_SUFFIXES, DimacsError, read_dimacs
+from .evaluate import check_model
+from .formula_cache import MappedFormula, read_cached
+from .limits import LimitExceeded, resource_limits
+from .solvers import solve
+from .stats import SolverStats
+
+STAT_COLUMNS = {
+    'Decisions': 'decisions',
+    'Conflicts': 'conflicts',
+    'Restarts': 'restarts',
+    'Learned Clauses': 'learned',
+    'Deleted Clauses': 'deleted',
+    'Kept Clauses': 'kept',
+    'Cubes': 'cubes',
+    'Eliminated Variables': 'eliminated',
+    'Fixed Literals': 'fixed',
+    'Flips': 'flips',
+    'Components': 'components',
+    'Propagations': 'propagations',
+    'Resolvents': 'resolvents',
+    'Tautologies': 'tautologies',
+    'Eliminated Clauses': 'eliminated_clauses',
+    'Max Formula Size': 'max_formula_size',
+    'Propagation Time (s)': 'propagation_time',
+    'Branching Time (s)': 'branching_time',
+    'Analysis Time (s)': 'analysis_time',
+    'Resolution Time (s)': 'resolution_time',
+}
+
+
+def find_cnf_files(cnf_dir_path):
+    """Returns the sorted paths of every (possibly compressed) CNF file below a directory."""
+    cnf_files = []
+    for suffix in CNF_SUFFIXES:
+        cnf_files.extend(glob.glob(os.path.join(cnf_dir_path, '**', '*' + suffix), recursive=True))
+    return sorted(cnf_files)
+
+
+def make_row(cnf_file_path, solver, heuristic, restarts, result, error=None, stats=None, **measurements):
+    """Builds one result row; measurements not given are 0."""
+    stats = stats or {}
+    row = {
+        'File': os.path.basename(cnf_file_path),
+        'Solver': solver,
+        'Heuristic': heuristic or 'default',
+        'Restart Policy': restarts or 'default',
+        'Result': result,
+        'Time (s)': measurements.get('time', 0),
+        'CPU Time (s)': measurements.get('cpu_time', 0),
+        'Peak Memory (KB)': measurements.get('peak_memory', 0),
+        'Variables': measurements.get('variables', 0),
+        'Clauses': measurements.get('clauses', 0),
+        'PAR-2 (s)': measurements.get('par2'),
+        'Verified': measurements.get('verified'),
+    }
+    for column, key in STAT_COLUMNS.items():
+        row[column] = stats.get(key, 0)
+    row['Winner'] = stats.get('winner')
+    row['Error'] = error
+    return row
+
+
+def describe_row(row):
+    """Returns the one-line progress message for a result row."""
+    if row['Error'] is not None:
+        return f"  {row['Result']}: {row['Error']}"
+    return (f"  Result: {row['Result']}, Time: {row['Time (s)']:.4f}s, "
+            f"Mem: {row['Peak Memory (KB)']:.2f}KB, Restarts: {row['Restarts']}")
+
+
+def par2_penalty(time_limit=None, cpu_limit=None):
+    """Returns the PAR-2 charge for an unsolved file, twice the time limit, or None without one."""
+    limit = time_limit if time_limit is not None else cpu_limit
+    return None if limit is None else 2 * limit
+
+
+def benchmark_file(cnf_file_path, solver="dpll", heuristic=None, restarts=None, formula_cache=None,
+                   time_limit=None, cpu_limit=None, memory_limit=None, simplify=None):
+    """
+    Parses and solves one CNF file under tracemalloc and returns its result row.
+    formula_cache: None parses the file; True keeps a binary cache file next
+    to it and a directory path keeps the cache there, keyed by content hash.
+    time_limit and cpu_limit are seconds of wall-clock and CPU time for the
+    solve, memory_limit is a cap in MB on the address space the solve adds.
+    simplify is passed to solvers in satcore.solvers.SIMPLIFY_SOLVERS.
+    """
+    try:
+        if formula_cache is None:
+            clauses, num_vars, num_clauses = read_dimacs(cnf_file_path)
+        else:
+            cache_dir = None if formula_cache is True else formula_cache
+            clauses, num_vars, num_clauses = read_cached(cnf_file_path, cache_dir)
+    except DimacsError as e:
+        return make_row(cnf_file_path, solver, heuristic, restarts, 'Parse Error', str(e),
+                        par2=par2_penalty(time_limit, cpu_limit))
+    except Exception as e:
+        return make_row(cnf_file_path, solver, heuristic, restarts, 'Read Error', str(e),
+                        par2=par2_penalty(time_limit, cpu_limit))
+    if not clauses:
+        return make_row(cnf_file_path, solver, heuristic, restarts, 'Parse Error', 'No clauses parsed',
+                        variables=num_vars, clauses=num_clauses, par2=par2_penalty(time_limit, cpu_limit))
+    stats = SolverStats()
+    assignments = {}
+    error = verified = None
+    try:
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        cpu0 = time.process_time()
+        try:
+            with resource_limits(time_limit, cpu_limit, memory_limit):
+                satisfiable, assignments = solve(clauses, num_vars, solver, stats, heuristic=heuristic,
+                                                 restarts=restarts, simplify=simplify)
+            result = {True: 'SAT', False: 'UNSAT', None: 'UNKNOWN'}[satisfiable]
+        except LimitExceeded as e:
+            result = e.result
+            error = str(e)
+        except Exception as e:
+            result = 'Crash'
+            error = repr(e)
+        finally:
+            cpu1 = time.process_time()
+            t1 = time.perf_counter()
+            _, peak_mem = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        if result == 'SAT' and assignments:
+            falsified = check_model(clauses, assignments)
+            verified = not falsified
+            if falsified:
+                error = f"Model falsifies {falsified} clauses"
+    finally:
+        if isinstance(clauses, MappedFormula):
+            clauses.close()
+    if error is None and result in ('SAT', 'UNSAT'):
+        par2 = t1 - t0 if time_limit is not None or cpu_limit is None else cpu1 - cpu0
+    else:
+        par2 = par2_penalty(time_limit, cpu_limit)
+    return make_row(cnf_file_path, solver, heuristic, restarts, result, error, stats,
+                    time=t1 - t0, cpu_time=cpu1 - cpu0, peak_memory=peak_mem / 1024,
+                    variables=num_vars, clauses=num_clauses, par2=par2, verified=verified)
+
+
+def _benchmark_worker(connection, cnf_file_path, options):
+    connection.send(benchmark_file(cnf_file_path, *options))
+    connection.close()
+
+
+def benchmark_parallel(cnf_files, workers, solver="dpll", heuristic=None, restarts=None, formula_cache=None,
+                       time_limit=None, cpu_limit=None, memory_limit=None, simplify=None):
+    """
+    Yields (index, row) for each of cnf_files as it finishes, running
+    benchmark_file() on up to workers files at a time. Every file gets a fresh
+    process that sends its row back through a pipe, so a worker killed by the
+    OS or exiting abruptly only turns its own file into a Crash row; the other
+    files are unaffected.
+    """
+    options = (solver, heuristic, restarts, formula_cache, time_limit, cpu_limit, memory_limit, simplify)
+    waiting = list(enumerate(cnf_files))
+    waiting.reverse()
+    running = {}
+    try:
+        while waiting or running:
+            while waiting and len(running) < workers:
+                i, cnf_file_path = waiting.pop()
+                reader, writer = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(target=_benchmark_worker, args=(writer, cnf_file_path, options))
+                process.start()
+                writer.close()
+                running[reader] = (i, process)
+            for reader in wait(list(running)):
+                i, process = running.pop(reader)
+                try:
+                    row = reader.recv()
+                except EOFError:
+                    process.join()
+                    row = make_row(cnf_files[i], solver, heuristic, restarts, 'Crash',
+                                   f"Worker process exited with code {process.exitcode}",
+                                   par2=par2_penalty(time_limit, cpu_limit))
+                finally:
+                    reader.close()
+                process.join()
+                yield i, row
+    finally:
+        for reader, (_, process) in running.items():
+            reader.close()
+            process.terminate()
+            process.join()
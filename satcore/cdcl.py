@@ -0,0 +1,239 @@
+"""Conflict-driven clause learning on top of the watched-literal Propagator."""
+import time
+
+from .clausedb import LearnedClauseDB
+from .heuristics import make_heuristic
+from .literals import num_variables
+from .propagation import Propagator
+from .restarts import make_restart_policy
+from .stats import SolverStats
+
+
+class CDCLSolver:
+    """
+    CDCL search: on every conflict the 1-UIP clause is learned and the search
+    jumps back to the second-highest decision level in that clause instead of
+    undoing only the last decision. The restart policy may send the search
+    back to level 0 after a conflict; phase saving then replays the previous
+    values of the variables it decides again. Learned clauses live in a
+    LearnedClauseDB that is reduced whenever its non-glue clauses outgrow
+    max_learned.
+
+    The solver is incremental: clauses can be added between solve() calls and
+    each call may pass assumptions. Learned clauses, heuristic scores and
+    saved phases carry over from one call to the next.
+
+    The propagation, branching and analysis times and the hook events go to
+    the SolverStats in self.stats; statistics() returns the counters.
+    """
+
+    def __init__(self, num_vars, heuristic="vsids", restarts="luby", phase_saving=True, max_learned=2000,
+                 stats=None):
+        self.num_vars = num_vars
+        self.stats = SolverStats() if stats is None else stats
+        self.prop = Propagator(num_vars)
+        self.heuristic_name = heuristic
+        self.heuristic = None
+        self.phase_saving = phase_saving
+        self.restart_policy = make_restart_policy(restarts)
+        self.clause_db = LearnedClauseDB(max_learned)
+        self.seen = [False] * (num_vars + 1)
+        self.decisions = 0
+        self.conflicts = 0
+        self.restarts = 0
+        self.core = []
+
+    def backtrack(self, level):
+        undone = self.prop.backtrack(level)
+        if self.heuristic is not None:
+            self.heuristic.unassigned(undone)
+
+    def add_clause(self, lits):
+        """Adds an input clause; returns False once the formula is unsatisfiable."""
+        self.backtrack(0)
+        return self.prop.add_clause(lits)
+
+    def analyze(self, conflict):
+        """
+        Derives the first-UIP clause from a falsified clause.
+        Returns (learned, level): learned[0] is the asserting literal and
+        learned[1], if present, has the highest level among the rest.
+        """
+        prop = self.prop
+        seen = self.seen
+        level = prop.level
+        trail = prop.trail
+        current = prop.decision_level()
+        learned = [0]
+        counter = 0
+        p = None
+        index = len(trail) - 1
+        clause_db = self.clause_db
+        reason = conflict
+        bump = self.heuristic.bump
+        while True:
+            clause = prop.clauses[reason]
+            if reason in clause_db:
+                clause_db.bump(reason)
+            for q in clause:
+                if q == p:
+                    continue
+                var = abs(q)
+                if not seen[var] and level[var] > 0:
+                    seen[var] = True
+                    bump(var)
+                    if level[var] >= current:
+                        counter += 1
+                    else:
+                        learned.append(q)
+            while not seen[abs(trail[index])]:
+                index -= 1
+            p = trail[index]
+            index -= 1
+            seen[abs(p)] = False
+            counter -= 1
+            if counter == 0:
+                break
+            reason = prop.reason[abs(p)]
+        learned[0] = -p
+        for q in learned[1:]:
+            seen[abs(q)] = False
+        if len(learned) == 1:
+            return learned, 0
+        highest = max(range(1, len(learned)), key=lambda i: level[abs(learned[i])])
+        learned[1], learned[highest] = learned[highest], learned[1]
+        return learned, level[abs(learned[1])]
+
+    def analyze_final(self, lit):
+        """
+        Returns the assumptions, lit first, whose propagation made the
+        assumption lit false.
+        """
+        prop = self.prop
+        core = [lit]
+        if prop.level[abs(lit)] == 0:
+            return core
+        seen = self.seen
+        seen[abs(lit)] = True
+        for p in reversed(prop.trail[prop.trail_lim[0]:]):
+            var = abs(p)
+            if not seen[var]:
+                continue
+            seen[var] = False
+            reason = prop.reason[var]
+            if reason is None:
+                core.append(p)
+                continue
+            for q in prop.clauses[reason]:
+                if q != p and prop.level[abs(q)] > 0:
+                    seen[abs(q)] = True
+        return list(dict.fromkeys(core))
+
+    def solve(self, assumptions=()):
+        """
+        Returns True if the clauses added so far are satisfiable with every
+        literal in assumptions true. The assumptions are decided first, one per
+        decision level, so nothing learned depends on them. On False, core
+        holds the assumptions that cannot all be true together, and is empty
+        when the clauses alone are unsatisfiable.
+        """
+        prop = self.prop
+        self.core = []
+        if not prop.ok:
+            return False
+        if self.heuristic is None:
+            self.heuristic = make_heuristic(self.heuristic_name, prop.clauses, self.num_vars, self.phase_saving)
+        self.backtrack(0)
+        assumptions = list(assumptions)
+        value = prop.value
+        stats = self.stats
+        clock = time.perf_counter
+        heuristic = self.heuristic
+        restart_policy = self.restart_policy
+        clause_db = self.clause_db
+        level_of = prop.level
+        while True:
+            start = clock()
+            conflict = prop.propagate()
+            stats.add_time("propagation", clock() - start)
+            if conflict is not None:
+                self.conflicts += 1
+                stats.emit("conflict", conflict)
+                if prop.decision_level() == 0:
+                    prop.ok = False
+                    return False
+                start = clock()
+                learned, level = self.analyze(conflict)
+                stats.add_time("analysis", clock() - start)
+                lbd = len({level_of[abs(lit)] for lit in learned})
+                stats.emit("learn", learned, lbd)
+                heuristic.decay()
+                clause_db.decay()
+                heuristic.unassigned(prop.backtrack(level))
+                if len(learned) == 1:
+                    prop.assign(learned[0])
+                else:
+                    index = prop.attach(learned)
+                    prop.assign(learned[0], index)
+                    clause_db.add(index, lbd)
+                    if clause_db.should_reduce():
+                        clause_db.reduce(prop)
+                if restart_policy.on_conflict(lbd):
+                    self.restarts += 1
+                    stats.emit("restart")
+                    heuristic.unassigned(prop.backtrack(0))
+                continue
+            level = prop.decision_level()
+            if level < len(assumptions):
+                lit = assumptions[level]
+                if value[lit] == 1:
+                    # Already implied: open an empty level so levels keep matching assumptions.
+                    prop.trail_lim.append(len(prop.trail))
+                elif value[lit] == -1:
+                    self.core = self.analyze_final(lit)
+                    return False
+                else:
+                    prop.decide(lit)
+                continue
+            start = clock()
+            lit = heuristic.pick(value)
+            stats.add_time("branching", clock() - start)
+            if lit is None:
+                return True
+            self.decisions += 1
+            stats.emit("decision", lit)
+            prop.decide(lit)
+
+    def model(self):
+        """Returns the satisfying assignment found by the last solve() as {variable: bool}."""
+        return self.prop.assignments()
+
+    def statistics(self):
+        return {
+            "decisions": self.decisions,
+            "conflicts": self.conflicts,
+            "restarts": self.restarts,
+            "propagations": self.prop.propagations,
+            "learned": self.clause_db.learned,
+            "deleted": self.clause_db.deleted,
+            "kept": len(self.clause_db),
+        }
+
+
+def solve_cdcl(clauses, num_vars=None, stats=None, heuristic="vsids", restarts="luby", phase_saving=True,
+               max_learned=2000):
+    """
+    Returns (satisfiable, assignments) using CDCL search.
+    If stats is a SolverStats it receives the solver counters and times.
+    """
+    if num_vars is None:
+        num_vars = num_variables(clauses)
+    solver = CDCLSolver(num_vars, heuristic, restarts, phase_saving, max_learned, stats)
+    try:
+        satisfiable = all(solver.add_clause(clause) for clause in clauses) and solver.solve()
+    finally:
+        if stats is not None:
+            stats.update(solver.statistics())
+    if not satisfiable:
+        return False, {}
+    return True, solver.model()
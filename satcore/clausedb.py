@@ -0,0 +1,77 @@
+"""Learned-clause bookkeeping for the CDCL solver."""
+
+
+class LearnedClauseDB:
+    """
+    Tracks the learned clauses of a Propagator with their literal block
+    distance (number of distinct decision levels when learned) and an activity
+    bumped whenever the clause takes part in conflict analysis.
+
+    Once more than max_learned non-glue clauses are stored, reduce() deletes
+    the worst half of them, worst meaning highest LBD and then lowest
+    activity. Glue clauses (LBD <= glue) and clauses that are the reason of a
+    current assignment are never deleted, and glue clauses do not count
+    towards max_learned, so keeping many of them does not trigger a reduction
+    on every conflict.
+    """
+
+    def __init__(self, max_learned=2000, glue=2, decay=0.999):
+        self.max_learned = max_learned
+        self.glue = glue
+        self.decay_factor = decay
+        self.increment = 1.0
+        self.lbd = {}
+        self.activity = {}
+        self.learned = 0
+        self.glue_clauses = 0
+        self.deleted = 0
+        self.reductions = 0
+
+    def __len__(self):
+        return len(self.lbd)
+
+    def __contains__(self, index):
+        return index in self.lbd
+
+    def add(self, index, lbd):
+        self.lbd[index] = lbd
+        self.activity[index] = self.increment
+        self.learned += 1
+        if lbd <= self.glue:
+            self.glue_clauses += 1
+
+    def bump(self, index):
+        activity = self.activity
+        activity[index] += self.increment
+        if activity[index] > 1e20:
+            for i in activity:
+                activity[i] *= 1e-20
+            self.increment *= 1e-20
+
+    def decay(self):
+        self.increment /= self.decay_factor
+
+    def should_reduce(self):
+        return len(self.lbd) - self.glue_clauses > self.max_learned
+
+    def reduce(self, prop):
+        """Detaches the worse half of the deletable learned clauses from prop."""
+        lbd = self.lbd
+        activity = self.activity
+        value = prop.value
+        reason = prop.reason
+        candidates = []
+        for index, clause_lbd in lbd.items():
+            if clause_lbd <= self.glue:
+                continue
+            first = prop.clauses[index][0]
+            if value[first] == 1 and reason[abs(first)] == index:
+                continue
+            candidates.append(index)
+        candidates.sort(key=lambda i: (-lbd[i], activity[i]))
+        for index in candidates[:len(candidates) // 2]:
+            prop.detach(index)
+            del lbd[index]
+            del activity[index]
+            self.deleted += 1
+        self.reductions += 1
@@ -0,0 +1,151 @@
+"""
+Connected-component decomposition: variable-disjoint parts of a formula are
+solved separately and their models merged, so the search spaces add up
+instead of multiplying.
+"""
+import multiprocessing
+from collections import Counter
+
+from .propagation import unit_prop
+from .solvers import solve
+
+
+class UnionFind:
+    """Disjoint sets over hashable items with path halving and union by size."""
+
+    def __init__(self):
+        self.parent = {}
+        self.size = {}
+
+    def find(self, item):
+        parent = self.parent
+        if item not in parent:
+            parent[item] = item
+            self.size[item] = 1
+            return item
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a, b):
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return a
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return a
+
+
+def split_components(clauses):
+    """Groups non-empty clauses into lists whose variables are connected through shared clauses."""
+    sets = UnionFind()
+    for clause in clauses:
+        first = None
+        for lit in clause:
+            var = abs(lit)
+            first = sets.find(var) if first is None else sets.union(first, var)
+    groups = {}
+    for clause in clauses:
+        groups.setdefault(sets.find(abs(next(iter(clause)))), []).append(clause)
+    return list(groups.values())
+
+
+def _solve_leaf(formula, solver, options):
+    """Renumbers one component to variables 1..k, solves it with the named solver and maps the model back."""
+    variables = sorted({abs(lit) for clause in formula for lit in clause})
+    index = {var: i for i, var in enumerate(variables, 1)}
+    clauses = [tuple(index[abs(lit)] if lit > 0 else -index[abs(lit)] for lit in clause) for clause in formula]
+    satisfiable, model = solve(clauses, len(variables), solver, **options)
+    if not satisfiable:
+        return satisfiable, {}
+    return True, {variables[i - 1]: value for i, value in model.items()}
+
+
+def _solve_part(task):
+    """
+    Solves one component. After every propagation the residual formula is
+    split again; a connected one is branched on its most frequent variable
+    until split_depth branchings, and then handed to the named solver.
+    Returns (satisfiable, assignments, number of components solved).
+    """
+    formula, solver, split_depth, options = task
+    count = 0
+
+    def search(formula, depth):
+        nonlocal count
+        formula, assignments = unit_prop(formula, {})
+        if frozenset() in formula:
+            return False, {}
+        if not formula:
+            return True, assignments
+        parts = split_components(formula)
+        if len(parts) > 1:
+            count += len(parts)
+            for part in sorted(parts, key=len):
+                satisfiable, model = search(part, depth)
+                if not satisfiable:
+                    return satisfiable, {}
+                assignments.update(model)
+            return True, assignments
+        if depth >= split_depth:
+            satisfiable, model = _solve_leaf(formula, solver, options)
+        else:
+            counts = Counter(abs(lit) for clause in formula for lit in clause)
+            var = counts.most_common(1)[0][0]
+            unknown = False
+            for lit in (var, -var):
+                satisfiable, model = search(formula | {frozenset((lit,))}, depth + 1)
+                if satisfiable:
+                    break
+                unknown = unknown or satisfiable is None
+            else:
+                satisfiable = None if unknown else False
+        if not satisfiable:
+            return satisfiable, {}
+        assignments.update(model)
+        return True, assignments
+
+    satisfiable, assignments = search(formula, 0)
+    return satisfiable, assignments, count
+
+
+def _merge(results, assignments):
+    """Merges part models into assignments until one part is not satisfiable; returns (satisfiable, components)."""
+    count = 0
+    for satisfiable, model, components in results:
+        count += components
+        if not satisfiable:
+            return satisfiable, count
+        assignments.update(model)
+    return True, count
+
+
+def solve_components(clauses, num_vars=None, stats=None, solver="dpll-inplace", split_depth=4, workers=1,
+                     **options):
+    """
+    Propagates units, splits the formula into connected components with a
+    union-find over its variables and solves each one with _solve_part(),
+    which keeps splitting after every branch. With workers > 1 the top-level
+    components are solved on a process pool that is terminated as soon as one
+    of them is unsatisfiable. options are passed on to the named solver.
+    Returns (satisfiable, assignments); a SolverStats receives "components".
+    """
+    formula, assignments = unit_prop({frozenset(clause) for clause in clauses}, {})
+    if frozenset() in formula:
+        return False, {}
+    parts = split_components(formula)
+    tasks = [(set(part), solver, split_depth, options) for part in parts]
+    if workers > 1 and len(tasks) > 1:
+        with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+            satisfiable, nested = _merge(pool.imap_unordered(_solve_part, tasks, chunksize=1), assignments)
+    else:
+        satisfiable, nested = _merge(map(_solve_part, tasks), assignments)
+    if stats is not None:
+        stats["components"] = len(parts) + nested
+    if not satisfiable:
+        return satisfiable, {}
+    return True, assignments
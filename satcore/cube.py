@@ -0,0 +1,120 @@
+"""
+Cube-and-conquer: a lookahead splits the formula into cubes (conjunctions of
+literals) and a process pool solves the formula under each cube.
+"""
+import math
+import multiprocessing
+import os
+
+from .literals import num_variables
+from .propagation import Propagator
+from .solvers import solve
+
+
+def _lookahead(prop, cube, candidates):
+    """
+    Probes both literals of every unassigned candidate. When one side conflicts
+    the other is asserted and appended to the cube, and the candidates are
+    probed again. Returns the variable whose two probes imply the most literals
+    together, 0 when no candidate is left, or None when the cube is refuted.
+    """
+    while True:
+        best, best_score, failed = 0, -1, False
+        for var in candidates:
+            if prop.value[var]:
+                continue
+            pos = prop.probe(var)
+            neg = prop.probe(-var)
+            if pos is None or neg is None:
+                if pos is None and neg is None:
+                    return None
+                lit = -var if pos is None else var
+                cube.append(lit)
+                prop.assign(lit)
+                if prop.propagate() is not None:
+                    return None
+                failed = True
+            elif (pos + 1) * (neg + 1) > best_score:
+                best, best_score = var, (pos + 1) * (neg + 1)
+        if not failed:
+            return best
+
+
+def make_cubes(clauses, num_vars, depth, candidates=32):
+    """
+    Splits on up to depth lookahead variables and returns the list of cubes
+    whose propagation does not conflict; an empty list means the formula is
+    unsatisfiable. Only the candidates unassigned variables occurring most
+    often in the formula are probed at each node.
+    """
+    prop = Propagator(num_vars)
+    if not prop.add_clauses(clauses):
+        return []
+    counts = [0] * (num_vars + 1)
+    for clause in clauses:
+        for lit in clause:
+            counts[abs(lit)] += 1
+    order = sorted(range(1, num_vars + 1), key=counts.__getitem__, reverse=True)
+    cubes = []
+
+    def split(cube, depth):
+        unassigned = [var for var in order if not prop.value[var]][:candidates]
+        var = _lookahead(prop, cube, unassigned)
+        if var is None:
+            return
+        if depth == 0 or var == 0:
+            cubes.append(cube)
+            return
+        for lit in (var, -var):
+            prop.decide(lit)
+            if prop.propagate() is None:
+                split(cube + [lit], depth - 1)
+            prop.backtrack(prop.decision_level() - 1)
+
+    split([], depth)
+    return cubes
+
+
+_formula = None
+
+
+def _init_worker(clauses, num_vars, solver, options):
+    global _formula
+    _formula = (clauses, num_vars, solver, options)
+
+
+def _solve_cube(cube):
+    clauses, num_vars, solver, options = _formula
+    return solve(clauses + [(lit,) for lit in cube], num_vars, solver, **options)
+
+
+def solve_cubes(clauses, num_vars=None, stats=None, depth=None, workers=None, solver="dpll-inplace", **options):
+    """
+    Cube-and-conquer with the named solver from satcore.solvers.SOLVERS
+    conquering each cube; options are passed on to it. workers defaults to
+    every CPU and depth to about four cubes per worker. Cubes are handed out
+    one at a time, so a worker that finishes early takes the next open cube,
+    and the pool is terminated as soon as one cube is satisfiable.
+    Returns (satisfiable, assignments), with satisfiable None when no cube is
+    satisfiable but an incomplete solver left one undecided; a SolverStats
+    receives "cubes".
+    """
+    if num_vars is None:
+        num_vars = num_variables(clauses)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if depth is None:
+        depth = max(1, math.ceil(math.log2(4 * workers)))
+    clauses = [tuple(clause) for clause in clauses]
+    cubes = make_cubes(clauses, num_vars, depth)
+    if stats is not None:
+        stats["cubes"] = len(cubes)
+    if not cubes:
+        return False, {}
+    unknown = False
+    with multiprocessing.Pool(workers, _init_worker, (clauses, num_vars, solver, options)) as pool:
+        for satisfiable, assignments in pool.imap_unordered(_solve_cube, cubes, chunksize=1):
+            if satisfiable:
+                return True, assignments
+            unknown = unknown or satisfiable is None
+    return (None if unknown else False), {}
@@ -0,0 +1,100 @@
+"""
+Streaming DIMACS CNF reader.
+
+The input is read line by line and each clause goes straight into the integer
+clause list, so the file is never held in memory as one string. Files ending
+in .gz, .bz2, .xz or .lzma are decompressed on the fly.
+"""
+import bz2
+import gzip
+import lzma
+import os
+
+OPENERS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".lzma": lzma.open,
+}
+
+CNF_SUFFIXES = (".cnf",) + tuple(".cnf" + ext for ext in OPENERS)
+
+
+class DimacsError(ValueError):
+    """Raised for malformed DIMACS input or a problem line that does not match the clauses."""
+
+
+def open_cnf(path):
+    """Opens a possibly compressed CNF file for reading text."""
+    opener = OPENERS.get(os.path.splitext(path)[1].lower(), open)
+    return opener(path, "rt")
+
+
+def parse_dimacs(lines, check_header=True):
+    """
+    Parses DIMACS CNF from an iterable of lines. A clause ends at its 0 and may
+    span several lines, and a missing 0 after the last clause is tolerated.
+    Comment lines are skipped and a '%' line (as in the SATLIB files) ends the
+    formula. Duplicate literals and duplicate clauses are
+    dropped. With check_header, a DimacsError is raised when the clause count
+    or a variable index disagrees with the 'p cnf' line.
+    Returns (clauses, num_vars, num_clauses).
+    """
+    header = None
+    clauses = []
+    seen = set()
+    current = []
+    max_var = 0
+    count = 0
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line[0] == "c":
+            continue
+        if line[0] == "%":
+            break
+        if line[0] == "p":
+            parts = line.split()
+            if len(parts) != 4 or parts[1] != "cnf" or header is not None:
+                raise DimacsError(f"line {line_no}: invalid problem line '{line}'")
+            try:
+                header = (int(parts[2]), int(parts[3]))
+            except ValueError:
+                raise DimacsError(f"line {line_no}: invalid problem line '{line}'") from None
+            continue
+        try:
+            lits = [int(token) for token in line.split()]
+        except ValueError:
+            raise DimacsError(f"line {line_no}: invalid literal in '{line}'") from None
+        for lit in lits:
+            if lit:
+                current.append(lit)
+                continue
+            count += 1
+            clause = tuple(sorted(set(current), key=abs))
+            current = []
+            if clause:
+                max_var = max(max_var, abs(clause[-1]))
+            if clause not in seen:
+                seen.add(clause)
+                clauses.append(clause)
+    if current:
+        count += 1
+        clause = tuple(sorted(set(current), key=abs))
+        max_var = max(max_var, abs(clause[-1]))
+        if clause not in seen:
+            clauses.append(clause)
+    if header is None:
+        return clauses, max_var, len(clauses)
+    num_vars, num_clauses = header
+    if check_header:
+        if max_var > num_vars:
+            raise DimacsError(f"variable {max_var} exceeds the {num_vars} declared in the problem line")
+        if count != num_clauses:
+            raise DimacsError(f"found {count} clauses, the problem line declares {num_clauses}")
+    return clauses, max(num_vars, max_var), len(clauses)
+
+
+def read_dimacs(path, check_header=True):
+    """Reads a (possibly compressed) DIMACS CNF file; see parse_dimacs()."""
+    with open_cnf(path) as f:
+        return parse_dimacs(f, check_header)
@@ -0,0 +1,193 @@
+"""Davis-Putnam variable elimination over integer clauses."""
+import heapq
+import time
+from collections import defaultdict
+from itertools import combinations
+
+from .stats import SolverStats
+from .subsumption import ClauseSet
+
+ORDERINGS = ("greedy", "min-degree", "min-fill", "first")
+
+
+def elimination_cost(occurs, var):
+    """Estimated change in clause count from eliminating var: |pos|*|neg| - |pos| - |neg|."""
+    pos = len(occurs.get(var, ()))
+    neg = len(occurs.get(-var, ()))
+    return pos * neg - pos - neg
+
+
+def elimination_order(clauses, heuristic="min-degree"):
+    """
+    Plays the elimination game on the variable interaction graph and returns
+    the variables in elimination order. The next variable is the one with the
+    fewest neighbours ("min-degree") or the fewest missing edges between its
+    neighbours ("min-fill"); its neighbours then become a clique.
+    """
+    graph = defaultdict(set)
+    for clause in clauses:
+        variables = {abs(lit) for lit in clause}
+        for var in variables:
+            graph[var].update(variables)
+            graph[var].discard(var)
+
+    def score(var):
+        neighbours = graph[var]
+        if heuristic == "min-degree":
+            return len(neighbours)
+        return sum(1 for a, b in combinations(neighbours, 2) if b not in graph[a])
+
+    heap = [(score(var), var) for var in graph]
+    heapq.heapify(heap)
+    order = []
+    while heap:
+        old_score, var = heapq.heappop(heap)
+        if var not in graph:
+            continue
+        new_score = score(var)
+        if new_score != old_score:
+            heapq.heappush(heap, (new_score, var))
+            continue
+        neighbours = graph.pop(var)
+        order.append(var)
+        for other in neighbours:
+            graph[other].discard(var)
+            graph[other].update(neighbours)
+            graph[other].discard(other)
+        affected = set(neighbours)
+        if heuristic == "min-fill":
+            for other in neighbours:
+                affected.update(graph[other])
+        for other in affected:
+            heapq.heappush(heap, (score(other), other))
+    return order
+
+
+def eliminate(kept, var, stats=None):
+    """
+    Eliminates var from a ClauseSet in place: its clauses are replaced by the
+    resolvents that no kept clause subsumes. Returns (positive clauses removed,
+    variables whose occurrences changed, added resolvents), or None when the
+    empty clause is derived. A SolverStats counts the "resolvents" generated
+    and the "tautologies" among them.
+    """
+    pos = list(kept.occurs.get(var, ()))
+    neg = list(kept.occurs.get(-var, ()))
+    touched = set()
+    for clause in pos + neg:
+        kept.remove(clause)
+        touched.update(abs(lit) for lit in clause)
+    resolvents = []
+    generated = tautologies = 0
+    try:
+        for p in pos:
+            p_rest = p - {var}
+            for n in neg:
+                res = p_rest | (n - {-var})
+                generated += 1
+                if not res:
+                    return None
+                if any(-lit in res for lit in res):
+                    tautologies += 1
+                    continue
+                if res in kept or kept.is_subsumed(res):
+                    continue
+                for clause in kept.remove_subsumed(res):
+                    touched.update(abs(lit) for lit in clause)
+                kept.insert(res)
+                resolvents.append(res)
+    finally:
+        if stats is not None:
+            stats.count("resolvents", generated)
+            stats.count("tautologies", tautologies)
+    touched.discard(var)
+    return pos, touched, resolvents
+
+
+def extend_model(assignments, eliminated):
+    """
+    Sets the variables of an elimination stack of (var, removed positive
+    clauses) in reverse order: var becomes True only when one of its positive
+    clauses is not satisfied by the other literals. Every other variable of
+    the removed clauses must already have a value.
+    """
+    for var, pos in reversed(eliminated):
+        assignments[var] = not all(
+            any(assignments.get(abs(lit)) == (lit > 0) for lit in clause if lit != var) for clause in pos
+        )
+    return assignments
+
+
+def solve_sat(formula, assignments=None, order="greedy", stats=None):
+    """
+    Returns (satisfiable, assignments) found by DP elimination with subsumption.
+    Variables with a unit clause go first. Otherwise order picks the next one:
+    "greedy" keeps a priority queue of elimination_cost() that is updated for
+    the variables whose clauses change, "min-degree" and "min-fill" follow
+    elimination_order() computed up front, and "first" takes a variable of an
+    arbitrary clause. Input variables that were never eliminated, including
+    those found only in dropped tautologies, are set to False and the
+    eliminated ones are set from their removed positive clauses in reverse
+    elimination order.
+    A SolverStats receives the resolvent counts, the number of variables
+    "eliminated" and the clauses they removed, the largest clause count and
+    the resolution time, and an "eliminate" event after every step.
+    """
+    if order not in ORDERINGS:
+        raise ValueError(f"Unknown elimination order '{order}', expected one of: {', '.join(ORDERINGS)}")
+    assignments = {} if assignments is None else assignments
+    if stats is None:
+        stats = SolverStats()
+    clock = time.perf_counter
+    kept = ClauseSet()
+    units = []
+    variables = set()
+    for clause in formula:
+        clause = frozenset(clause)
+        if not clause:
+            return False, {}
+        variables.update(abs(lit) for lit in clause)
+        if not any(-lit in clause for lit in clause) and kept.add(clause) and len(clause) == 1:
+            units.append(clause)
+    occurs = kept.occurs
+    stats.maximum("max_formula_size", len(kept))
+    if order == "greedy":
+        queue = [(elimination_cost(occurs, var), var) for var in variables]
+        heapq.heapify(queue)
+    elif order != "first":
+        schedule = iter(elimination_order(kept, order))
+    eliminated = []
+    while kept:
+        if units:
+            var = abs(next(iter(units.pop())))
+        elif order == "greedy":
+            cost, var = heapq.heappop(queue)
+            new_cost = elimination_cost(occurs, var)
+            if new_cost != cost:
+                heapq.heappush(queue, (new_cost, var))
+                continue
+        elif order == "first":
+            var = abs(next(iter(next(iter(kept)))))
+        else:
+            var = next(schedule)
+        removed = len(occurs.get(var, ())) + len(occurs.get(-var, ()))
+        if not removed:
+            continue
+        start = clock()
+        result = eliminate(kept, var, stats)
+        stats.add_time("resolution", clock() - start)
+        if result is None:
+            return False, {}
+        pos, touched, resolvents = result
+        eliminated.append((var, pos))
+        stats.count("eliminated")
+        stats.count("eliminated_clauses", removed)
+        stats.maximum("max_formula_size", len(kept))
+        stats.emit("eliminate", var, removed, len(resolvents))
+        units.extend(res for res in resolvents if len(res) == 1)
+        if order == "greedy":
+            for other in touched:
+                heapq.heappush(queue, (elimination_cost(occurs, other), other))
+    for var in variables:
+        assignments.setdefault(var, False)
+    return True, extend_model(assignments, eliminated)
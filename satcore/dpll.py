@@ -0,0 +1,126 @@
+"""DPLL search over integer clauses."""
+import time
+
+from .heuristics import make_heuristic
+from .literals import num_variables
+from .propagation import Propagator, unit_prop
+from .simplify import PureLiterals, fix_literals, simplify_root
+from .stats import SolverStats
+
+
+def solve_sat(formula, assignments=None, simplify=False, stats=None):
+    """
+    Branches on a variable of the shortest clause after unit propagation.
+    Returns (satisfiable, assignments).
+
+    Open branches are kept on an explicit stack as (parent formula, parent
+    assignments, branch literal), so the search depth is not limited by the
+    recursion limit and a branch's formula is only built when it is explored.
+    With simplify, pure literals and failed literals are fixed at the root
+    first and counted as "fixed" in the SolverStats. Every literal assigned by
+    unit propagation, decisions included, counts as one of its "propagations".
+    """
+    assignments = {} if assignments is None else assignments
+    if stats is None:
+        stats = SolverStats()
+    stats["decisions"] = stats["conflicts"] = stats["propagations"] = 0
+    if simplify:
+        units, fixed = simplify_root(formula)
+        stats["fixed"] = fixed
+        if units is None:
+            return False, {}
+        formula = {frozenset(clause) for clause in formula} | {frozenset((lit,)) for lit in units}
+    clock = time.perf_counter
+    stack = [(formula, assignments, None)]
+    while stack:
+        formula, assignments, lit = stack.pop()
+        if lit is not None:
+            stats["decisions"] += 1
+            stats.emit("decision", lit)
+            formula = formula | {frozenset((lit,))}
+        stats.maximum("max_formula_size", len(formula))
+        start = clock()
+        assigned = len(assignments)
+        formula, assignments = unit_prop(formula, dict(assignments))
+        stats.add_time("propagation", clock() - start)
+        stats["propagations"] += len(assignments) - assigned
+        if not formula:
+            return True, assignments
+        if frozenset() in formula:
+            stats["conflicts"] += 1
+            stats.emit("conflict", None)
+            continue
+        start = clock()
+        var = abs(next(iter(min(formula, key=len))))
+        stats.add_time("branching", clock() - start)
+        stack.append((formula, assignments, -var))
+        stack.append((formula, assignments, var))
+    return False, {}
+
+
+def solve_inplace(clauses, num_vars=None, stats=None, heuristic="vsids", phase_saving=True,
+                  simplify=False, probe_levels=1):
+    """
+    DPLL on a single Propagator: a decision opens a trail level and a conflict
+    undoes the trail back to the last unflipped decision, so nothing is copied.
+    With VSIDS the variables of each falsified clause are bumped.
+    With simplify, pure literals are assigned after every propagation and
+    failed literals are probed below decision level probe_levels; the number
+    of literals they fix is stats["fixed"].
+    Returns (satisfiable, assignments); stats is a SolverStats that receives
+    the counters and the propagation and branching times.
+    Backtracking is chronological, so there are no restarts here: without
+    learned clauses a restart would throw away the proof of the refuted branches.
+    """
+    if num_vars is None:
+        num_vars = num_variables(clauses)
+    if stats is None:
+        stats = SolverStats()
+    stats["decisions"] = stats["conflicts"] = stats["fixed"] = 0
+    prop = Propagator(num_vars)
+    try:
+        if not prop.add_clauses(clauses):
+            return False, {}
+        order = make_heuristic(heuristic, prop.clauses, num_vars, phase_saving)
+        pure = PureLiterals(prop, clauses) if simplify else None
+        clock = time.perf_counter
+        decisions = []
+        while True:
+            start = clock()
+            conflict = prop.propagate()
+            stats.add_time("propagation", clock() - start)
+            refuted = conflict is not None
+            if not refuted and simplify:
+                fixed = fix_literals(prop, pure, prop.decision_level() < probe_levels)
+                refuted = fixed is None
+                stats["fixed"] += fixed or 0
+            if refuted:
+                stats["conflicts"] += 1
+                stats.emit("conflict", conflict)
+                if conflict is not None:
+                    for lit in prop.clauses[conflict]:
+                        order.bump(abs(lit))
+                order.decay()
+                while decisions and decisions[-1][1]:
+                    decisions.pop()
+                if not decisions:
+                    return False, {}
+                lit, _ = decisions.pop()
+                undone = prop.backtrack(len(decisions))
+                order.unassigned(undone)
+                if simplify:
+                    pure.backtrack(undone)
+                decisions.append((-lit, True))
+                prop.decide(-lit)
+                continue
+            start = clock()
+            lit = order.pick(prop.value)
+            stats.add_time("branching", clock() - start)
+            if lit is None:
+                return True, prop.assignments()
+            stats["decisions"] += 1
+            stats.emit("decision", lit)
+            decisions.append((lit, False))
+            prop.decide(lit)
+    finally:
+        stats["propagations"] = prop.propagations
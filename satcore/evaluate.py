@@ -0,0 +1,97 @@
+"""
+Clause evaluation and model checking.
+
+ClauseMatrix stores the formula as padded NumPy literal matrices and scores
+one assignment or a whole batch of them with array operations; it needs
+NumPy, which is optional. falsified_clauses() checks a single assignment
+dict and works without it.
+"""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def numpy_available():
+    return np is not None
+
+
+def falsified_clauses(clauses, assignments):
+    """Returns the indices of the clauses with no literal made true by an assignments dict."""
+    return [index for index, clause in enumerate(clauses)
+            if not any(assignments.get(abs(lit)) == (lit > 0) for lit in clause)]
+
+
+class ClauseMatrix:
+    """
+    The formula as an (m, k) matrix of variables and a matching matrix of
+    literal signs, padded with variable 0 and masked out, where k is the
+    longest clause. Assignments are boolean arrays, or the int8 arrays of
+    to_array(), indexed by variable (column 0 is ignored), either one of shape
+    (num_vars + 1,) or a batch of shape (batch, num_vars + 1). Batches are
+    scored chunk_size rows at a time; by default the chunk is sized so that
+    its (chunk, m, k) gather stays around GATHER_ELEMENTS entries.
+    """
+
+    GATHER_ELEMENTS = 1 << 24
+
+    def __init__(self, clauses, num_vars=None, chunk_size=None):
+        if np is None:
+            raise ImportError("ClauseMatrix needs numpy")
+        clauses = [tuple(clause) for clause in clauses]
+        width = max((len(clause) for clause in clauses), default=0)
+        lits = np.zeros((len(clauses), width), dtype=np.int64)
+        for row, clause in enumerate(clauses):
+            lits[row, :len(clause)] = clause
+        self.variables = np.abs(lits)
+        self.positive = lits > 0
+        self.mask = lits != 0
+        self.num_clauses = len(clauses)
+        self.num_vars = max(int(self.variables.max(initial=0)), num_vars or 0)
+        if chunk_size is None:
+            chunk_size = max(1, self.GATHER_ELEMENTS // max(1, lits.size))
+        self.chunk_size = chunk_size
+
+    def to_array(self, assignments):
+        """
+        Turns an assignments dict into an int8 array of 1 for True and 0 for
+        False. Unassigned variables are -1, which makes no literal true, as in
+        falsified_clauses().
+        """
+        array = np.full(self.num_vars + 1, -1, dtype=np.int8)
+        for var, value in assignments.items():
+            array[var] = value
+        return array
+
+    def satisfied(self, assignments):
+        """Returns a boolean (batch, m) array, or (m,) for one assignment, of satisfied clauses."""
+        values = np.asarray(assignments)
+        single = values.ndim == 1
+        values = np.atleast_2d(values)
+        result = np.empty((len(values), self.num_clauses), dtype=bool)
+        for start in range(0, len(values), self.chunk_size):
+            chunk = values[start:start + self.chunk_size][:, self.variables]
+            result[start:start + self.chunk_size] = ((chunk == self.positive) & self.mask).any(axis=2)
+        return result[0] if single else result
+
+    def evaluate(self, assignments):
+        """Returns (satisfied, falsified) clause counts, as arrays for a batch."""
+        satisfied = self.satisfied(assignments).sum(axis=-1)
+        return satisfied, self.num_clauses - satisfied
+
+    def falsified_clauses(self, assignments):
+        """Returns the indices of the clauses one assignment, array or dict, leaves false."""
+        if isinstance(assignments, dict):
+            assignments = self.to_array(assignments)
+        return np.flatnonzero(~self.satisfied(assignments)).tolist()
+
+
+def check_model(clauses, assignments):
+    """
+    Returns the number of clauses an assignments dict falsifies, vectorised
+    when NumPy is installed.
+    """
+    if np is None:
+        return len(falsified_clauses(clauses, assignments))
+    matrix = ClauseMatrix(clauses, max(assignments, default=0))
+    return int(matrix.evaluate(matrix.to_array(assignments))[1])
@@ -0,0 +1,132 @@
+"""
+Binary on-disk cache of parsed CNF formulas.
+
+A cache file holds a fixed header, the clause offsets as int64 and all
+literals as one flat int32 array. Loading maps the file with mmap and reads
+clauses through memoryviews over it, so nothing is parsed or copied up front.
+Cache files are keyed by the SHA-256 of the CNF file's bytes, which is also
+stored in the header, so a stale file next to an edited CNF is ignored.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from .dimacs import read_dimacs
+
+MAGIC = b"SATCNF1" + (b"L" if sys.byteorder == "little" else b"B")
+HEADER = struct.Struct("=8s32sIIQ")
+SUFFIX = ".satc"
+
+
+class CacheError(ValueError):
+    """Raised when a cache file is truncated, from another platform or for other content."""
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """Returns the SHA-256 digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def cache_path(cnf_path, digest, cache_dir=None):
+    """Returns where the cache file of cnf_path lives: next to it, or in cache_dir under its digest."""
+    if cache_dir is None:
+        return cnf_path + SUFFIX
+    return os.path.join(cache_dir, digest.hex() + SUFFIX)
+
+
+def write_formula(path, clauses, num_vars, digest=bytes(32)):
+    """Writes clauses in the binary cache format, replacing path atomically."""
+    offsets = array("q", [0])
+    literals = array("i")
+    for clause in clauses:
+        literals.extend(clause)
+        offsets.append(len(literals))
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, digest, num_vars, len(offsets) - 1, len(literals)))
+        offsets.tofile(f)
+        literals.tofile(f)
+    os.replace(tmp_path, path)
+
+
+class MappedFormula:
+    """
+    Read-only clause sequence backed by a memory-mapped cache file.
+    Indexing or iterating yields clauses as tuples of ints.
+    """
+
+    def __init__(self, path, digest=None):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._map) < HEADER.size:
+                raise CacheError(f"{path}: truncated header")
+            magic, stored_digest, self.num_vars, num_clauses, num_literals = HEADER.unpack_from(self._map)
+            if magic != MAGIC:
+                raise CacheError(f"{path}: not a formula cache for this platform")
+            if digest is not None and stored_digest != digest:
+                raise CacheError(f"{path}: cached for different content")
+            literals_start = HEADER.size + 8 * (num_clauses + 1)
+            if len(self._map) != literals_start + 4 * num_literals:
+                raise CacheError(f"{path}: unexpected file size")
+            view = memoryview(self._map)
+            self._offsets = view[HEADER.size:literals_start].cast("q")
+            self._literals = view[literals_start:].cast("i")
+            view.release()
+        except Exception:
+            self._map.close()
+            raise
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return tuple(self._literals[self._offsets[i]:self._offsets[i + 1]])
+
+    def __iter__(self):
+        literals = self._literals
+        offsets = self._offsets
+        for i in range(len(offsets) - 1):
+            yield tuple(literals[offsets[i]:offsets[i + 1]])
+
+    def close(self):
+        self._offsets.release()
+        self._literals.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_cached(cnf_path, cache_dir=None, check_header=True):
+    """
+    Returns (clauses, num_vars, num_clauses) for a CNF file, loading its binary
+    cache when one exists for the file's current content and otherwise parsing
+    the file and writing the cache. Cached clauses come back as a MappedFormula.
+    """
+    digest = file_digest(cnf_path)
+    path = cache_path(cnf_path, digest, cache_dir)
+    if os.path.exists(path):
+        try:
+            formula = MappedFormula(path, digest)
+        except CacheError:
+            pass
+        else:
+            return formula, formula.num_vars, len(formula)
+    clauses, num_vars, num_clauses = read_dimacs(cnf_path, check_header)
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+    write_formula(path, clauses, num_vars, digest)
+    return clauses, num_vars, num_clauses
@@ -0,0 +1,221 @@
+"""
+Decision heuristics for the trail-based solvers.
+
+Every heuristic keeps the unassigned variables in a binary max-heap ordered by
+its score, so picking the next decision costs O(log n) instead of a pass over
+the formula. Assigned variables are dropped lazily when they reach the top and
+pushed back by unassigned() when the solver backtracks over them. With phase
+saving, unassigned() also remembers the last value of each variable as the
+phase to try first next time.
+"""
+
+
+class VarHeap:
+    """Binary max-heap of variables keyed by a shared score list, with O(log n) updates."""
+
+    def __init__(self, scores):
+        self.scores = scores
+        self.heap = []
+        self.index = [-1] * len(scores)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, var):
+        return self.index[var] >= 0
+
+    def push(self, var):
+        if self.index[var] >= 0:
+            return
+        self.index[var] = len(self.heap)
+        self.heap.append(var)
+        self._sift_up(len(self.heap) - 1)
+
+    def pop(self):
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.index[top] = -1
+        if heap:
+            heap[0] = last
+            self.index[last] = 0
+            self._sift_down(0)
+        return top
+
+    def increased(self, var):
+        """Restores the heap order after the score of var went up."""
+        if self.index[var] >= 0:
+            self._sift_up(self.index[var])
+
+    def _sift_up(self, i):
+        heap = self.heap
+        index = self.index
+        scores = self.scores
+        var = heap[i]
+        score = scores[var]
+        while i > 0:
+            parent = (i - 1) >> 1
+            parent_var = heap[parent]
+            if scores[parent_var] >= score:
+                break
+            heap[i] = parent_var
+            index[parent_var] = i
+            i = parent
+        heap[i] = var
+        index[var] = i
+
+    def _sift_down(self, i):
+        heap = self.heap
+        index = self.index
+        scores = self.scores
+        size = len(heap)
+        var = heap[i]
+        score = scores[var]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and scores[heap[child + 1]] > scores[heap[child]]:
+                child += 1
+            child_var = heap[child]
+            if scores[child_var] <= score:
+                break
+            heap[i] = child_var
+            index[child_var] = i
+            i = child
+        heap[i] = var
+        index[var] = i
+
+
+class Heuristic:
+    """
+    Picks the unassigned variable with the highest score.
+    polarity[var] is the phase tried first (True for the positive literal).
+    """
+
+    name = None
+    phase_saving = False
+
+    def __init__(self, scores, polarity):
+        self.scores = scores
+        self.polarity = polarity
+        self.heap = VarHeap(scores)
+        for var in sorted(range(1, len(scores)), key=scores.__getitem__, reverse=True):
+            self.heap.push(var)
+
+    def pick(self, value):
+        """Returns the next decision literal, or None when every variable is assigned."""
+        heap = self.heap
+        while heap:
+            var = heap.pop()
+            if value[var] == 0:
+                return var if self.polarity[var] else -var
+        return None
+
+    def unassigned(self, lits):
+        """Makes the variables of backtracked literals available for decisions again."""
+        push = self.heap.push
+        if self.phase_saving:
+            polarity = self.polarity
+            for lit in lits:
+                var = abs(lit)
+                polarity[var] = lit > 0
+                push(var)
+        else:
+            for lit in lits:
+                push(abs(lit))
+
+    def bump(self, var):
+        pass
+
+    def decay(self):
+        pass
+
+
+class VSIDS(Heuristic):
+    """
+    Variable State Independent Decaying Sum: variables met during conflict
+    analysis are bumped, and older bumps fade because the increment grows by
+    1 / decay after every conflict.
+    """
+
+    name = "vsids"
+
+    def __init__(self, clauses, num_vars, decay=0.95):
+        super().__init__([0.0] * (num_vars + 1), [False] * (num_vars + 1))
+        self.increment = 1.0
+        self.decay_factor = decay
+
+    def bump(self, var):
+        scores = self.scores
+        scores[var] += self.increment
+        if scores[var] > 1e100:
+            for v in range(1, len(scores)):
+                scores[v] *= 1e-100
+            self.increment *= 1e-100
+        self.heap.increased(var)
+
+    def decay(self):
+        self.increment /= self.decay_factor
+
+
+def _literal_weights(clauses, num_vars, weight):
+    totals = [0.0] * (2 * num_vars + 1)
+    for clause in clauses:
+        w = weight(len(clause))
+        for lit in clause:
+            totals[lit] += w
+    return totals
+
+
+class MOMS(Heuristic):
+    """
+    Maximum Occurrences in clauses of Minimum Size, scored once on the input:
+    (f(x) + f(-x)) * 2^k + f(x) * f(-x) over the shortest clauses, with the
+    total occurrence count breaking ties.
+    """
+
+    name = "moms"
+
+    def __init__(self, clauses, num_vars):
+        shortest = min((len(clause) for clause in clauses), default=0)
+        counts = _literal_weights((c for c in clauses if len(c) == shortest), num_vars, lambda size: 1)
+        totals = _literal_weights(clauses, num_vars, lambda size: 1)
+        tie_scale = 2 * len(clauses) + 1
+        scores = [0.0] * (num_vars + 1)
+        polarity = [False] * (num_vars + 1)
+        for var in range(1, num_vars + 1):
+            pos, neg = counts[var], counts[-var]
+            moms = (pos + neg) * 2 ** shortest + pos * neg
+            scores[var] = moms * tie_scale + totals[var] + totals[-var]
+            polarity[var] = totals[var] >= totals[-var]
+        super().__init__(scores, polarity)
+
+
+class JeroslowWang(Heuristic):
+    """Two-sided Jeroslow-Wang: J(l) is the sum of 2^-|C| over the clauses C containing l."""
+
+    name = "jw"
+
+    def __init__(self, clauses, num_vars):
+        weights = _literal_weights(clauses, num_vars, lambda size: 2.0 ** -size)
+        scores = [0.0] * (num_vars + 1)
+        polarity = [False] * (num_vars + 1)
+        for var in range(1, num_vars + 1):
+            scores[var] = weights[var] + weights[-var]
+            polarity[var] = weights[var] >= weights[-var]
+        super().__init__(scores, polarity)
+
+
+HEURISTICS = {cls.name: cls for cls in (VSIDS, MOMS, JeroslowWang)}
+
+
+def make_heuristic(name, clauses, num_vars, phase_saving=False):
+    """Builds the named heuristic for a formula."""
+    try:
+        cls = HEURISTICS[name]
+    except KeyError:
+        raise ValueError(f"Unknown heuristic '{name}', expected one of: {', '.join(HEURISTICS)}") from None
+    heuristic = cls(clauses, num_vars)
+    heuristic.phase_saving = phase_saving
+    return heuristic
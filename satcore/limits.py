@@ -0,0 +1,92 @@
+"""
+Wall-clock, CPU-time and memory limits around a single solve.
+
+The time limits are interval timers whose signal handlers raise Timeout
+inside the running solver, and the memory cap lowers RLIMIT_AS so that an
+allocation beyond it raises MemoryError, reported as Memout. All three are
+installed in the calling process and restored afterwards, which is why the
+benchmark runs them inside each worker. They need a POSIX platform.
+
+RLIMIT_AS covers the whole address space of the process, including the
+interpreter and every library it has already loaded. Where the current size
+can be read from /proc/self/statm (Linux) the cap is therefore set that far
+above it, so memory_mb only counts what the solve itself maps; elsewhere it
+is the absolute size of the process.
+"""
+import signal
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+class LimitExceeded(Exception):
+    """Base class of the limit errors; result is the label used in benchmark rows."""
+
+    result = None
+
+
+class Timeout(LimitExceeded):
+    result = "TIMEOUT"
+
+
+class Memout(LimitExceeded):
+    result = "MEMOUT"
+
+
+def limits_supported():
+    return hasattr(signal, "setitimer") and resource is not None
+
+
+def address_space():
+    """Returns the current virtual size of the process in bytes, or 0 when it cannot be read."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+@contextmanager
+def resource_limits(wall_time=None, cpu_time=None, memory_mb=None):
+    """
+    Raises Timeout once wall_time or cpu_time seconds have passed inside the
+    block and Memout when it runs out of memory under a memory_mb cap on the
+    address space the block adds to the process. Limits left as None are not
+    enforced.
+    """
+    if wall_time is None and cpu_time is None and memory_mb is None:
+        yield
+        return
+    if not limits_supported():
+        raise OSError("Solver resource limits need signal.setitimer and the resource module (POSIX)")
+
+    def on_timer(signum, frame):
+        raise Timeout(f"{'wall-clock' if signum == signal.SIGALRM else 'CPU'} time limit reached")
+
+    timers = []
+    if wall_time is not None:
+        timers.append((signal.ITIMER_REAL, signal.SIGALRM, signal.signal(signal.SIGALRM, on_timer)))
+        signal.setitimer(signal.ITIMER_REAL, wall_time)
+    if cpu_time is not None:
+        timers.append((signal.ITIMER_PROF, signal.SIGPROF, signal.signal(signal.SIGPROF, on_timer)))
+        signal.setitimer(signal.ITIMER_PROF, cpu_time)
+    old_memory = None
+    if memory_mb is not None:
+        old_memory = resource.getrlimit(resource.RLIMIT_AS)
+        soft = address_space() + memory_mb * 1024 * 1024
+        if old_memory[1] != resource.RLIM_INFINITY:
+            soft = min(soft, old_memory[1])
+        resource.setrlimit(resource.RLIMIT_AS, (soft, old_memory[1]))
+    try:
+        yield
+    except MemoryError:
+        raise Memout(f"memory limit of {memory_mb} MB reached" if memory_mb else "out of memory") from None
+    finally:
+        for timer, signum, handler in timers:
+            signal.setitimer(timer, 0)
+            signal.signal(signum, handler)
+        if old_memory is not None:
+            resource.setrlimit(resource.RLIMIT_AS, old_memory)
@@ -0,0 +1,53 @@
+"""
+Integer literal encoding shared by the solvers.
+
+Literals are DIMACS-style signed ints: variable v is written v when positive
+and -v when negated, so negation is -lit and the variable is abs(lit).
+Clauses are tuples of literals and a formula is a list of clauses.
+"""
+
+
+def parse_literal(literal):
+    """Splits a string literal like '-x17' into its variable name and sign."""
+    if literal.startswith("-"):
+        return literal[1:], False
+    return literal, True
+
+
+def encode_formula(formula, names=None):
+    """
+    Converts string clauses (sets of '-x17'-style literals) into integer clauses.
+    Returns (clauses, names) where names[v] is the string name of variable v.
+    Pass an existing names list to keep the numbering of an earlier call.
+    """
+    if names is None:
+        names = [None]
+    index = {name: var for var, name in enumerate(names) if name is not None}
+    clauses = []
+    for clause in formula:
+        lits = set()
+        for literal in clause:
+            name, positive = parse_literal(literal)
+            var = index.get(name)
+            if var is None:
+                var = len(names)
+                names.append(name)
+                index[name] = var
+            lits.add(var if positive else -var)
+        clauses.append(tuple(lits))
+    return clauses, names
+
+
+def decode_formula(clauses, names):
+    """Converts integer clauses back into sets of string literals."""
+    return [{names[lit] if lit > 0 else "-" + names[-lit] for lit in clause} for clause in clauses]
+
+
+def decode_assignments(assignments, names):
+    """Maps {variable: bool} over integer variables back onto the string names."""
+    return {names[var]: value for var, value in assignments.items()}
+
+
+def num_variables(clauses):
+    """Returns the largest variable index used by the clauses."""
+    return max((abs(lit) for clause in clauses for lit in clause), default=0)
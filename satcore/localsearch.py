@@ -0,0 +1,157 @@
+"""
+Stochastic local search: WalkSAT and ProbSAT.
+
+Both keep a full assignment and repeatedly flip a variable of a random
+falsified clause. For every clause the number of true literals and their sum
+are kept up to date, so a clause with a single true literal knows which
+variable it depends on. From that, break[var] (the clauses that flipping var
+would falsify) and make[var] (the falsified clauses that flipping var would
+satisfy) are updated incrementally on every flip. Local search cannot prove
+unsatisfiability, so running out of flips returns (None, {}).
+"""
+import random
+
+from .literals import num_variables
+from .stats import SolverStats
+
+ALGORITHMS = ("walksat", "probsat")
+
+
+class LocalSearch:
+    def __init__(self, clauses, num_vars, rng):
+        self.num_vars = num_vars
+        self.rng = rng
+        self.clauses = []
+        self.occurs = [[] for _ in range(2 * num_vars + 1)]
+        for clause in clauses:
+            clause = tuple(dict.fromkeys(clause))
+            if any(-lit in clause for lit in clause):
+                continue
+            for lit in clause:
+                self.occurs[lit].append(len(self.clauses))
+            self.clauses.append(clause)
+
+    def reset(self):
+        """Starts from a random assignment and recomputes every counter."""
+        rng = self.rng
+        num_vars = self.num_vars
+        self.value = [False] + [rng.random() < 0.5 for _ in range(num_vars)]
+        self.true_count = [0] * len(self.clauses)
+        self.true_sum = [0] * len(self.clauses)
+        self.breaks = [0] * (num_vars + 1)
+        self.makes = [0] * (num_vars + 1)
+        self.unsat = []
+        self.unsat_pos = [-1] * len(self.clauses)
+        value = self.value
+        for index, clause in enumerate(self.clauses):
+            count = total = 0
+            for lit in clause:
+                if value[abs(lit)] == (lit > 0):
+                    count += 1
+                    total += lit
+            self.true_count[index] = count
+            self.true_sum[index] = total
+            if count == 0:
+                self._falsified(index)
+            elif count == 1:
+                self.breaks[abs(total)] += 1
+
+    def _falsified(self, index):
+        self.unsat_pos[index] = len(self.unsat)
+        self.unsat.append(index)
+        for lit in self.clauses[index]:
+            self.makes[abs(lit)] += 1
+
+    def _satisfied(self, index):
+        pos = self.unsat_pos[index]
+        last = self.unsat.pop()
+        if last != index:
+            self.unsat[pos] = last
+            self.unsat_pos[last] = pos
+        self.unsat_pos[index] = -1
+        for lit in self.clauses[index]:
+            self.makes[abs(lit)] -= 1
+
+    def flip(self, var):
+        value = self.value
+        value[var] = not value[var]
+        lit = var if value[var] else -var
+        true_count = self.true_count
+        true_sum = self.true_sum
+        breaks = self.breaks
+        for index in self.occurs[lit]:
+            count = true_count[index]
+            if count == 0:
+                self._satisfied(index)
+                breaks[var] += 1
+            elif count == 1:
+                breaks[abs(true_sum[index])] -= 1
+            true_count[index] = count + 1
+            true_sum[index] += lit
+        for index in self.occurs[-lit]:
+            count = true_count[index] - 1
+            true_count[index] = count
+            true_sum[index] += lit
+            if count == 0:
+                self._falsified(index)
+                breaks[var] -= 1
+            elif count == 1:
+                breaks[abs(true_sum[index])] += 1
+
+    def pick_walksat(self, clause, noise):
+        """A variable that breaks nothing, else a random one with probability noise, else the least breaking one."""
+        breaks = self.breaks
+        variables = [abs(lit) for lit in clause]
+        best = min(breaks[var] for var in variables)
+        if best > 0 and self.rng.random() < noise:
+            return self.rng.choice(variables)
+        candidates = [var for var in variables if breaks[var] == best]
+        most = max(self.makes[var] for var in candidates)
+        return self.rng.choice([var for var in candidates if self.makes[var] == most])
+
+    def pick_probsat(self, clause, cb, eps=1.0):
+        """A variable drawn with probability proportional to (eps + break) ** -cb."""
+        breaks = self.breaks
+        variables = [abs(lit) for lit in clause]
+        weights = [(eps + breaks[var]) ** -cb for var in variables]
+        return self.rng.choices(variables, weights)[0]
+
+
+def solve_local(clauses, num_vars=None, stats=None, algorithm="walksat", noise=0.5, cb=2.3,
+                max_flips=100000, max_tries=10, seed=None):
+    """
+    Runs up to max_tries rounds of at most max_flips flips each, every round
+    from a fresh random assignment. WalkSAT flips with the given noise; ProbSAT
+    weights the variables of the chosen clause by (1 + break) ** -cb.
+    Returns (True, assignments), (False, {}) when the formula has an empty
+    clause, or (None, {}) when no model was found. A SolverStats receives
+    "flips" and "restarts".
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown local search algorithm '{algorithm}', expected one of: {', '.join(ALGORITHMS)}")
+    if num_vars is None:
+        num_vars = num_variables(clauses)
+    if stats is None:
+        stats = SolverStats()
+    stats["flips"] = stats["restarts"] = 0
+    search = LocalSearch(clauses, num_vars, random.Random(seed))
+    if any(not clause for clause in search.clauses):
+        return False, {}
+    for attempt in range(max_tries):
+        if attempt:
+            stats["restarts"] += 1
+        search.reset()
+        unsat = search.unsat
+        for _ in range(max_flips):
+            if not unsat:
+                break
+            clause = search.clauses[unsat[search.rng.randrange(len(unsat))]]
+            if algorithm == "walksat":
+                var = search.pick_walksat(clause, noise)
+            else:
+                var = search.pick_probsat(clause, cb)
+            search.flip(var)
+            stats["flips"] += 1
+        if not unsat:
+            return True, {var: search.value[var] for var in range(1, num_vars + 1)}
+    return None, {}
@@ -0,0 +1,71 @@
+"""
+Portfolio solving: several engines race on the same formula in separate
+processes and the first definitive answer wins.
+"""
+import multiprocessing
+import time
+from multiprocessing.connection import wait
+
+from .solvers import solve
+
+DEFAULT_ENGINES = ("cdcl", "dpll-inplace", "dp", "resolution")
+MODELLESS_ENGINES = {"resolution"}
+
+
+def _race(engine, clauses, num_vars, connection):
+    try:
+        satisfiable, assignments = solve(clauses, num_vars, engine)
+    except Exception as e:
+        connection.send((None, {}, repr(e)))
+    else:
+        connection.send((satisfiable, assignments, None))
+    connection.close()
+
+
+def solve_portfolio(clauses, num_vars, engines=DEFAULT_ENGINES, timeout=None):
+    """
+    Starts one process per engine name from satcore.solvers.SOLVERS and returns
+    (satisfiable, assignments, winner) for the first engine that answers SAT or
+    UNSAT; the other processes are terminated. Engines that fail, answer None
+    or die without answering do not count: each engine reports through its own
+    pipe, which reads as closed once the process is gone. Engines in
+    MODELLESS_ENGINES only win with UNSAT, since their SAT answer comes without
+    a model. Returns (None, {}, None) when no engine answers within timeout
+    seconds.
+    """
+    clauses = [tuple(clause) for clause in clauses]
+    pending = {}
+    processes = []
+    try:
+        for engine in engines:
+            reader, writer = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(target=_race, args=(engine, clauses, num_vars, writer), daemon=True)
+            process.start()
+            writer.close()
+            pending[reader] = engine
+            processes.append(process)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready = wait(list(pending), remaining)
+            if not ready:
+                break
+            for reader in ready:
+                engine = pending.pop(reader)
+                try:
+                    satisfiable, assignments, _ = reader.recv()
+                except EOFError:
+                    continue
+                finally:
+                    reader.close()
+                if satisfiable is False or (satisfiable and engine not in MODELLESS_ENGINES):
+                    return satisfiable, assignments, engine
+        return None, {}, None
+    finally:
+        for reader in pending:
+            reader.close()
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
@@ -0,0 +1,143 @@
+"""
+SatELite-style preprocessing: subsumption, self-subsuming resolution and
+bounded variable elimination, with a stack to rebuild full models.
+"""
+import heapq
+
+from .dp import eliminate, elimination_cost, extend_model
+from .literals import num_variables
+from .solvers import solve
+from .subsumption import ClauseSet, signature
+
+
+def _strengthen(kept, clause):
+    """
+    Self-subsuming resolution against the kept clauses: drops every literal l
+    of clause for which a kept clause D has D - {-l} inside clause - {l}.
+    """
+    changed = True
+    while changed:
+        changed = False
+        for lit in clause:
+            flipped = (clause - {lit}) | {-lit}
+            sig = signature(flipped)
+            for other in kept.occurs.get(-lit, ()):
+                if not kept.signatures[other] & ~sig and other <= flipped:
+                    clause = clause - {lit}
+                    changed = True
+                    break
+            if changed:
+                break
+    return clause
+
+
+def _self_subsume(kept, clause, queue):
+    """Removes -l from every kept clause holding (clause - {l}) | {-l}; the shortened clauses are queued."""
+    for lit in clause:
+        pattern = (clause - {lit}) | {-lit}
+        sig = signature(pattern)
+        targets = [other for other in kept.occurs.get(-lit, ())
+                   if not sig & ~kept.signatures[other] and pattern <= other]
+        for other in targets:
+            kept.remove(other)
+            queue.append(other - {-lit})
+
+
+def _add(kept, clauses):
+    """
+    Adds clauses with forward and backward subsumption and strengthening.
+    Returns False when the empty clause is derived.
+    """
+    queue = list(clauses)
+    while queue:
+        clause = _strengthen(kept, queue.pop())
+        if not clause:
+            return False
+        if clause in kept or kept.is_subsumed(clause):
+            continue
+        kept.remove_subsumed(clause)
+        _self_subsume(kept, clause, queue)
+        kept.insert(clause)
+    return True
+
+
+def _resolvent_count(kept, var, limit):
+    """Counts the non-tautological resolvents on var, stopping once there are more than limit."""
+    count = 0
+    neg = kept.occurs.get(-var, ())
+    for p in kept.occurs.get(var, ()):
+        for n in neg:
+            if not any(-lit in n for lit in p if lit != var):
+                count += 1
+                if count > limit:
+                    return count
+    return count
+
+
+def preprocess(clauses, grow=0, frozen=()):
+    """
+    Simplifies integer clauses and returns (clauses, eliminated), where
+    eliminated is the stack dp.extend_model() needs to rebuild a full model;
+    clauses is None when the formula is found unsatisfiable.
+
+    Clauses are added with subsumption and self-subsuming resolution. Then the
+    variables outside frozen are tried cheapest elimination_cost() first, and
+    one is eliminated with dp.eliminate() only when it has at most grow more
+    non-tautological resolvents than clauses. The new resolvents are
+    simplified like the input, and the variables they touch are tried again.
+    """
+    kept = ClauseSet()
+    formula = (frozenset(clause) for clause in clauses)
+    if not _add(kept, [clause for clause in formula if not any(-lit in clause for lit in clause)]):
+        return None, []
+    occurs = kept.occurs
+    queue = [(elimination_cost(occurs, var), var) for var in {abs(lit) for lit in occurs}]
+    heapq.heapify(queue)
+    eliminated = []
+    while queue:
+        cost, var = heapq.heappop(queue)
+        if var in frozen or not occurs.get(var) and not occurs.get(-var):
+            continue
+        new_cost = elimination_cost(occurs, var)
+        if new_cost != cost:
+            heapq.heappush(queue, (new_cost, var))
+            continue
+        limit = len(occurs.get(var, ())) + len(occurs.get(-var, ())) + grow
+        if _resolvent_count(kept, var, limit) > limit:
+            continue
+        result = eliminate(kept, var)
+        if result is None:
+            return None, eliminated
+        pos, touched, resolvents = result
+        eliminated.append((var, pos))
+        resolvents = [res for res in resolvents if res in kept]
+        for res in resolvents:
+            kept.remove(res)
+        if not _add(kept, resolvents):
+            return None, eliminated
+        for other in touched:
+            heapq.heappush(queue, (elimination_cost(occurs, other), other))
+    return [tuple(sorted(clause, key=abs)) for clause in kept], eliminated
+
+
+def solve_preprocessed(clauses, num_vars=None, stats=None, solver="dpll-inplace", grow=0, **options):
+    """
+    Runs preprocess() and hands the reduced formula to the named solver from
+    satcore.solvers.SOLVERS with options, then extends its model to the
+    eliminated variables. Returns (satisfiable, assignments); a SolverStats
+    receives the solver's counters and "eliminated".
+    """
+    if num_vars is None:
+        num_vars = num_variables(clauses)
+    reduced, eliminated = preprocess(clauses, grow)
+    if reduced is None:
+        satisfiable, assignments = False, {}
+    else:
+        satisfiable, assignments = solve(reduced, num_vars, solver, stats, **options)
+    if stats is not None:
+        stats["eliminated"] = len(eliminated)
+    if not satisfiable:
+        return satisfiable, {}
+    for var in range(1, num_vars + 1):
+        assignments.setdefault(var, False)
+    return True, extend_model(assignments, eliminated)
@@ -0,0 +1,207 @@
+"""Unit propagation over integer clauses."""
+
+
+def unit_prop(formula, assignments):
+    """
+    Repeatedly assigns unit clauses and simplifies the formula with them.
+    Returns (formula, assignments); the formula is {frozenset()} on a conflict.
+    """
+    formula = {frozenset(cl) for cl in formula}
+    while True:
+        unit = None
+        for clause in formula:
+            if len(clause) == 1:
+                (unit,) = clause
+                break
+        if unit is None:
+            return formula, assignments
+        assignments[abs(unit)] = unit > 0
+        neg_unit = -unit
+        new_formula = set()
+        for clause in formula:
+            if unit in clause:
+                continue
+            if neg_unit in clause:
+                clause = clause - {neg_unit}
+                if not clause:
+                    return {frozenset()}, assignments
+            new_formula.add(clause)
+        formula = new_formula
+
+
+class Propagator:
+    """
+    Unit propagation with two watched literals, a propagation queue and an
+    assignment trail.
+
+    value[lit] is 1 when lit is true, -1 when it is false and 0 when it is
+    unassigned; the list has 2 * num_vars + 1 slots so both lit and -lit index it
+    directly. Every stored clause keeps its two watched literals in positions 0
+    and 1 and is listed in watches[lit] for both of them, so assigning p only
+    visits the clauses in watches[-p].
+    """
+
+    def __init__(self, num_vars):
+        self.num_vars = num_vars
+        self.value = [0] * (2 * num_vars + 1)
+        self.level = [0] * (num_vars + 1)
+        self.reason = [None] * (num_vars + 1)
+        self.watches = [[] for _ in range(2 * num_vars + 1)]
+        self.clauses = []
+        self.free = []
+        self.trail = []
+        self.trail_lim = []
+        self.qhead = 0
+        self.ok = True
+        self.propagations = 0
+
+    def decision_level(self):
+        return len(self.trail_lim)
+
+    def add_clause(self, lits):
+        """
+        Adds a clause at decision level 0, dropping tautologies, satisfied clauses
+        and false literals. Returns False once the formula is unsatisfiable.
+        """
+        if not self.ok:
+            return False
+        value = self.value
+        clause = []
+        seen = set()
+        for lit in lits:
+            if value[lit] == 1 or -lit in seen:
+                return True
+            if value[lit] == 0 and lit not in seen:
+                seen.add(lit)
+                clause.append(lit)
+        if not clause:
+            self.ok = False
+        elif len(clause) == 1:
+            self.assign(clause[0])
+            self.ok = self.propagate() is None
+        else:
+            self.attach(clause)
+        return self.ok
+
+    def add_clauses(self, clauses):
+        for clause in clauses:
+            if not self.add_clause(clause):
+                return False
+        return True
+
+    def attach(self, clause):
+        """Stores a clause of two or more literals watching its first two; returns its index."""
+        if self.free:
+            index = self.free.pop()
+            self.clauses[index] = clause
+        else:
+            index = len(self.clauses)
+            self.clauses.append(clause)
+        self.watches[clause[0]].append(index)
+        self.watches[clause[1]].append(index)
+        return index
+
+    def detach(self, index):
+        """Removes a stored clause; its slot is reused by the next attach()."""
+        clause = self.clauses[index]
+        self.watches[clause[0]].remove(index)
+        self.watches[clause[1]].remove(index)
+        self.clauses[index] = None
+        self.free.append(index)
+
+    def assign(self, lit, reason=None):
+        """Puts lit on the trail as true; reason is the index of the implying clause."""
+        self.value[lit] = 1
+        self.value[-lit] = -1
+        var = abs(lit)
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def decide(self, lit):
+        """Opens a new decision level and assigns lit on it."""
+        self.trail_lim.append(len(self.trail))
+        self.assign(lit)
+
+    def probe(self, lit):
+        """
+        Propagates lit on a new decision level and undoes it.
+        Returns the number of implied literals, or None on a conflict.
+        """
+        start = len(self.trail)
+        self.decide(lit)
+        conflict = self.propagate()
+        implied = len(self.trail) - start
+        self.backtrack(len(self.trail_lim) - 1)
+        return None if conflict is not None else implied
+
+    def propagate(self):
+        """
+        Propagates every queued assignment.
+        Returns the index of a falsified clause, or None when there is no conflict.
+        """
+        value = self.value
+        watches = self.watches
+        clauses = self.clauses
+        trail = self.trail
+        while self.qhead < len(trail):
+            false_lit = -trail[self.qhead]
+            self.qhead += 1
+            self.propagations += 1
+            watch_list = watches[false_lit]
+            i = j = 0
+            n = len(watch_list)
+            while i < n:
+                index = watch_list[i]
+                i += 1
+                clause = clauses[index]
+                if clause[0] == false_lit:
+                    clause[0] = clause[1]
+                    clause[1] = false_lit
+                first = clause[0]
+                if value[first] == 1:
+                    watch_list[j] = index
+                    j += 1
+                    continue
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if value[lit] != -1:
+                        clause[1] = lit
+                        clause[k] = false_lit
+                        watches[lit].append(index)
+                        break
+                else:
+                    watch_list[j] = index
+                    j += 1
+                    if value[first] == -1:
+                        while i < n:
+                            watch_list[j] = watch_list[i]
+                            j += 1
+                            i += 1
+                        del watch_list[j:]
+                        self.qhead = len(trail)
+                        return index
+                    self.assign(first, index)
+            del watch_list[j:]
+        return None
+
+    def backtrack(self, level):
+        """Undoes every assignment above the given decision level; returns the undone literals."""
+        if len(self.trail_lim) <= level:
+            return []
+        start = self.trail_lim[level]
+        undone = self.trail[start:]
+        value = self.value
+        reason = self.reason
+        for lit in undone:
+            value[lit] = 0
+            value[-lit] = 0
+            reason[abs(lit)] = None
+        del self.trail[start:]
+        del self.trail_lim[level:]
+        self.qhead = start
+        return undone
+
+    def assignments(self):
+        """Returns the current trail as a {variable: bool} dict."""
+        return {abs(lit): lit > 0 for lit in self.trail}
@@ -0,0 +1,71 @@
+"""Saturation-based resolution over integer clauses."""
+import heapq
+import time
+
+from .stats import SolverStats
+from .subsumption import ClauseSet
+
+
+def solve_resolution(initial_formula, stats=None):
+    """
+    Returns False if the empty clause is derivable, True otherwise.
+
+    Given-clause saturation: clauses wait in a passive queue, shortest first.
+    The chosen clause is resolved only against the active clauses holding the
+    negation of one of its literals, found through a literal-to-clauses index,
+    and then becomes active itself, so every pair of clauses is resolved once.
+    Resolvents subsumed by a kept clause are dropped, and kept clauses that a
+    new resolvent subsumes are deleted from both the active and passive sets.
+    A SolverStats receives the resolvent counts, the largest clause count and
+    the resolution time, and a "resolvent" event for every kept resolvent.
+    """
+    if stats is None:
+        stats = SolverStats()
+    start = time.perf_counter()
+    try:
+        return _saturate(initial_formula, stats)
+    finally:
+        stats.add_time("resolution", time.perf_counter() - start)
+
+
+def _saturate(initial_formula, stats):
+    kept = ClauseSet()
+    passive = []
+    count = 0
+    for clause in initial_formula:
+        clause = frozenset(clause)
+        if not clause:
+            return False
+        if not any(-lit in clause for lit in clause) and kept.add(clause):
+            count += 1
+            heapq.heappush(passive, (len(clause), count, clause))
+    active = set()
+    occurs = kept.occurs
+    while passive:
+        _, _, given = heapq.heappop(passive)
+        if given not in kept or given in active:
+            continue
+        resolvents = []
+        for lit in given:
+            rest = given - {lit}
+            for other in occurs.get(-lit, ()):
+                if other in active:
+                    r = rest | (other - {-lit})
+                    stats.count("resolvents")
+                    if not r:
+                        return False
+                    if any(-x in r for x in r):
+                        stats.count("tautologies")
+                    else:
+                        resolvents.append(r)
+        active.add(given)
+        for r in resolvents:
+            if r in kept or kept.is_subsumed(r):
+                continue
+            active.difference_update(kept.remove_subsumed(r))
+            kept.insert(r)
+            stats.emit("resolvent", r)
+            count += 1
+            heapq.heappush(passive, (len(r), count, r))
+        stats.maximum("max_formula_size", len(kept))
+    return True
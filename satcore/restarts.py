@@ -0,0 +1,110 @@
+"""
+Restart policies for the CDCL search.
+
+A policy is told about every conflict through on_conflict(lbd) and answers
+whether the solver should backtrack to level 0 now. Learned clauses survive a
+restart, so the search stays complete.
+"""
+from collections import deque
+
+
+def luby(i):
+    """Returns the i-th term (1-based) of the Luby sequence 1 1 2 1 1 2 4 1 1 2 ..."""
+    while True:
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+        if i == (1 << k) - 1:
+            return 1 << (k - 1)
+        i -= (1 << (k - 1)) - 1
+
+
+class NoRestarts:
+    name = "none"
+
+    def on_conflict(self, lbd):
+        return False
+
+
+class LubyRestarts:
+    """Restarts after unit * luby(n) conflicts for the n-th run."""
+
+    name = "luby"
+
+    def __init__(self, unit=100):
+        self.unit = unit
+        self.runs = 1
+        self.count = 0
+        self.limit = unit * luby(1)
+
+    def on_conflict(self, lbd):
+        self.count += 1
+        if self.count < self.limit:
+            return False
+        self.count = 0
+        self.runs += 1
+        self.limit = self.unit * luby(self.runs)
+        return True
+
+
+class GeometricRestarts:
+    """Restarts after first, first * factor, first * factor^2, ... conflicts."""
+
+    name = "geometric"
+
+    def __init__(self, first=100, factor=1.5):
+        self.factor = factor
+        self.count = 0
+        self.limit = first
+
+    def on_conflict(self, lbd):
+        self.count += 1
+        if self.count < self.limit:
+            return False
+        self.count = 0
+        self.limit *= self.factor
+        return True
+
+
+class GlucoseRestarts:
+    """
+    Glucose-style dynamic restarts: restart when the average LBD of the last
+    window learned clauses, scaled by margin, exceeds the average over the
+    whole run, i.e. when recent learned clauses are unusually poor.
+    """
+
+    name = "glucose"
+
+    def __init__(self, window=50, margin=0.8):
+        self.window = window
+        self.margin = margin
+        self.recent = deque(maxlen=window)
+        self.recent_sum = 0
+        self.total = 0
+        self.count = 0
+
+    def on_conflict(self, lbd):
+        self.total += lbd
+        self.count += 1
+        if len(self.recent) == self.window:
+            self.recent_sum -= self.recent[0]
+        self.recent.append(lbd)
+        self.recent_sum += lbd
+        if len(self.recent) < self.window:
+            return False
+        if self.recent_sum / self.window * self.margin <= self.total / self.count:
+            return False
+        self.recent.clear()
+        self.recent_sum = 0
+        return True
+
+
+RESTART_POLICIES = {cls.name: cls for cls in (LubyRestarts, GeometricRestarts, GlucoseRestarts, NoRestarts)}
+
+
+def make_restart_policy(name):
+    """Builds the named restart policy with its default parameters."""
+    try:
+        return RESTART_POLICIES[name]()
+    except KeyError:
+        raise ValueError(f"Unknown restart policy '{name}', expected one of: {', '.join(RESTART_POLICIES)}") from None
@@ -0,0 +1,91 @@
+"""
+Memoisation of solve results keyed by a canonical formula hash.
+
+The hash ignores the order of clauses and of the literals inside them, and
+duplicate literals and clauses, so a reordered copy of a formula hits the
+same entry. Results live in a size-bounded LRU dictionary and, when a path
+is given, in a sqlite database that outlives the process. Unknown (None)
+answers from incomplete solvers are never cached.
+"""
+import hashlib
+import json
+import sqlite3
+from collections import OrderedDict
+
+
+def canonical_hash(clauses):
+    """Returns a hex SHA-256 digest of the formula that is invariant to clause and literal order."""
+    canonical = sorted({tuple(sorted(set(clause))) for clause in clauses})
+    digest = hashlib.sha256()
+    for clause in canonical:
+        digest.update(" ".join(map(str, clause)).encode())
+        digest.update(b" 0\n")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Maps keys to (satisfiable, assignments). At most max_entries results are
+    kept in memory, least recently used first out; with path every result is
+    also stored in sqlite and looked up there on a memory miss.
+    """
+
+    def __init__(self, max_entries=1024, path=None):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path)
+            self.db.execute("CREATE TABLE IF NOT EXISTS results "
+                            "(key TEXT PRIMARY KEY, satisfiable INTEGER, model TEXT)")
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def key(clauses, solver="", **options):
+        """Key for a formula solved by a named solver with options (options left as None are ignored)."""
+        options = sorted((name, value) for name, value in options.items() if value is not None)
+        return f"{canonical_hash(clauses)}:{solver}:{options!r}"
+
+    def _remember(self, key, result):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def get(self, key):
+        """Returns a copy of the cached (satisfiable, assignments), or None on a miss."""
+        result = self.entries.get(key)
+        if result is not None:
+            self.entries.move_to_end(key)
+        elif self.db is not None:
+            row = self.db.execute("SELECT satisfiable, model FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                result = (bool(row[0]), {abs(lit): lit > 0 for lit in json.loads(row[1])})
+                self._remember(key, result)
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result[0], dict(result[1])
+
+    def put(self, key, satisfiable, assignments):
+        if satisfiable is None:
+            return
+        result = (satisfiable, dict(assignments))
+        self._remember(key, result)
+        if self.db is not None:
+            model = json.dumps([var if value else -var for var, value in result[1].items()])
+            with self.db:
+                self.db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?)", (key, int(satisfiable), model))
+
+    def statistics(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries)}
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
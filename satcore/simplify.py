@@ -0,0 +1,138 @@
+"""
+Pure-literal elimination and failed-literal probing on top of a Propagator.
+"""
+from .literals import num_variables
+from .propagation import Propagator
+
+
+class PureLiterals:
+    """
+    Occurrence counters over the original clauses: count[lit] is the number of
+    clauses holding lit that no true literal satisfies yet. update() catches
+    up with the propagator's trail and reports the unassigned literals whose
+    negation no longer occurs in an unsatisfied clause; backtrack() undoes
+    the counts of the literals removed from the trail.
+    """
+
+    def __init__(self, prop, clauses):
+        size = 2 * prop.num_vars + 1
+        self.prop = prop
+        self.clauses = [tuple(clause) for clause in clauses]
+        self.occurs = [[] for _ in range(size)]
+        self.count = [0] * size
+        self.true_count = [0] * len(self.clauses)
+        for index, clause in enumerate(self.clauses):
+            for lit in clause:
+                self.occurs[lit].append(index)
+                self.count[lit] += 1
+        self.head = 0
+        self.pending = [lit for var in range(1, prop.num_vars + 1) for lit in (var, -var)
+                        if self.count[lit] and not self.count[-lit]]
+
+    def update(self):
+        """Returns the unassigned pure literals found since the last call."""
+        trail = self.prop.trail
+        value = self.prop.value
+        count = self.count
+        true_count = self.true_count
+        candidates = self.pending
+        self.pending = []
+        while self.head < len(trail):
+            lit = trail[self.head]
+            self.head += 1
+            for index in self.occurs[lit]:
+                true_count[index] += 1
+                if true_count[index] == 1:
+                    for other in self.clauses[index]:
+                        count[other] -= 1
+                        if not count[other]:
+                            candidates.append(-other)
+        return [lit for lit in dict.fromkeys(candidates)
+                if not value[lit] and count[lit] and not count[-lit]]
+
+    def backtrack(self, undone):
+        """Undoes the counts of the literals a Propagator.backtrack() call removed."""
+        start = len(self.prop.trail)
+        count = self.count
+        true_count = self.true_count
+        for lit in reversed(undone[:self.head - start]):
+            for index in self.occurs[lit]:
+                true_count[index] -= 1
+                if not true_count[index]:
+                    for other in self.clauses[index]:
+                        count[other] += 1
+        self.head = min(self.head, start)
+        self.pending = []
+
+
+def probe_failed_literals(prop):
+    """
+    Propagates both literals of every unassigned variable. When one side
+    conflicts the other is asserted on the current decision level, until a
+    full round finds no failed literal. Returns the asserted literals, or None
+    when both sides of a variable fail or an assertion conflicts.
+    """
+    fixed = []
+    found = True
+    while found:
+        found = False
+        for var in range(1, prop.num_vars + 1):
+            if prop.value[var]:
+                continue
+            pos = prop.probe(var)
+            neg = prop.probe(-var)
+            if pos is not None and neg is not None:
+                continue
+            if pos is None and neg is None:
+                return None
+            lit = -var if pos is None else var
+            prop.assign(lit)
+            fixed.append(lit)
+            if prop.propagate() is not None:
+                return None
+            found = True
+    return fixed
+
+
+def fix_literals(prop, pure=None, probing=False):
+    """
+    Propagates, then assigns the pure literals a PureLiterals tracker reports
+    and, with probing, the negations of failed literals, until neither finds
+    anything. Returns the number of literals fixed, or None on a conflict.
+    """
+    fixed = 0
+    while True:
+        if prop.propagate() is not None:
+            return None
+        lits = pure.update() if pure is not None else []
+        for lit in lits:
+            prop.assign(lit)
+        fixed += len(lits)
+        if lits:
+            continue
+        if probing:
+            failed = probe_failed_literals(prop)
+            if failed is None:
+                return None
+            fixed += len(failed)
+            if failed:
+                continue
+        return fixed
+
+
+def simplify_root(clauses, num_vars=None):
+    """
+    Runs fix_literals() with pure literals and probing on a fresh Propagator.
+    Returns the literals true at decision level 0 (including the unit
+    propagated ones) and the number fixed by simplification, or (None, fixed)
+    when the formula is unsatisfiable.
+    """
+    if num_vars is None:
+        num_vars = num_variables(clauses)
+    prop = Propagator(num_vars)
+    if not prop.add_clauses(clauses):
+        return None, 0
+    fixed = fix_literals(prop, PureLiterals(prop, clauses), probing=True)
+    if fixed is None:
+        return None, 0
+    return list(prop.trail), fixed
@@ -0,0 +1,121 @@
+"""
+Registry of the solvers run_benchmark can drive.
+
+Every entry takes (clauses, num_vars, stats=None) and returns
+(satisfiable, assignments); when stats is a satcore.stats.SolverStats the
+solver fills in its counters, phase times and hook events. The solvers in
+HEURISTIC_SOLVERS also take a heuristic name from satcore.heuristics.HEURISTICS
+and phase_saving, those in RESTART_SOLVERS take a restarts policy name from
+satcore.restarts.RESTART_POLICIES, and those in SIMPLIFY_SOLVERS take
+simplify to fix pure and failed literals.
+
+"dp" also takes an elimination order from satcore.dp.ORDERINGS and
+"resolution" reports no assignments at all. "portfolio" races the engines of
+satcore.portfolio.DEFAULT_ENGINES and stores the winner in stats["winner"].
+"cube" is cube-and-conquer over every CPU with "dpll-inplace" on each cube,
+and "bve" runs "dpll-inplace" after satcore.preprocess.preprocess().
+"walksat" and "probsat" are incomplete local search and answer None when they
+run out of flips. "components" solves the connected components of the formula
+separately, with "dpll-inplace" on each.
+"""
+from . import dp, dpll, resolution
+from .cdcl import solve_cdcl
+from .stats import SolverStats
+
+
+def _dpll_recursive(clauses, num_vars, stats=None, simplify=False):
+    return dpll.solve_sat(clauses, simplify=simplify, stats=stats)
+
+
+def _dp(clauses, num_vars, stats=None, **options):
+    return dp.solve_sat(clauses, stats=stats, **options)
+
+
+def _resolution(clauses, num_vars, stats=None):
+    return resolution.solve_resolution(clauses, stats), {}
+
+
+def _portfolio(clauses, num_vars, stats=None):
+    from .portfolio import solve_portfolio
+    satisfiable, assignments, winner = solve_portfolio(clauses, num_vars)
+    if stats is not None:
+        stats["winner"] = winner
+    return satisfiable, assignments
+
+
+def _cube(clauses, num_vars, stats=None, **options):
+    from .cube import solve_cubes
+    return solve_cubes(clauses, num_vars, stats, **options)
+
+
+def _bve(clauses, num_vars, stats=None, **options):
+    from .preprocess import solve_preprocessed
+    return solve_preprocessed(clauses, num_vars, stats, **options)
+
+
+def _walksat(clauses, num_vars, stats=None, **options):
+    from .localsearch import solve_local
+    return solve_local(clauses, num_vars, stats, "walksat", **options)
+
+
+def _probsat(clauses, num_vars, stats=None, **options):
+    from .localsearch import solve_local
+    return solve_local(clauses, num_vars, stats, "probsat", **options)
+
+
+def _components(clauses, num_vars, stats=None, **options):
+    from .components import solve_components
+    return solve_components(clauses, num_vars, stats, **options)
+
+
+SOLVERS = {
+    "dpll": _dpll_recursive,
+    "dpll-inplace": dpll.solve_inplace,
+    "cdcl": solve_cdcl,
+    "dp": _dp,
+    "resolution": _resolution,
+    "portfolio": _portfolio,
+    "cube": _cube,
+    "bve": _bve,
+    "walksat": _walksat,
+    "probsat": _probsat,
+    "components": _components,
+}
+
+HEURISTIC_SOLVERS = {"dpll-inplace", "cdcl", "cube", "bve", "components"}
+RESTART_SOLVERS = {"cdcl"}
+SIMPLIFY_SOLVERS = {"dpll", "dpll-inplace"}
+
+
+def solve(clauses, num_vars, solver="dpll", stats=None, cache=None, **options):
+    """
+    Runs the named solver on integer clauses. Options left as None keep the
+    solver's defaults. With a satcore.resultcache.ResultCache, a formula that
+    was already solved with the same solver and options is answered from the
+    cache and stats is left untouched. A plain dict as stats receives the
+    counters of a SolverStats when the solver returns.
+    """
+    try:
+        run = SOLVERS[solver]
+    except KeyError:
+        raise ValueError(f"Unknown solver '{solver}', expected one of: {', '.join(SOLVERS)}") from None
+    options = {name: value for name, value in options.items() if value is not None}
+    if "heuristic" in options and solver not in HEURISTIC_SOLVERS:
+        raise ValueError(f"Solver '{solver}' does not take a decision heuristic")
+    if "restarts" in options and solver not in RESTART_SOLVERS:
+        raise ValueError(f"Solver '{solver}' does not restart")
+    if "simplify" in options and solver not in SIMPLIFY_SOLVERS:
+        raise ValueError(f"Solver '{solver}' does not simplify")
+    record = stats if stats is None or isinstance(stats, SolverStats) else SolverStats()
+    try:
+        if cache is None:
+            return run(clauses, num_vars, record, **options)
+        key = cache.key(clauses, solver, **options)
+        result = cache.get(key)
+        if result is None:
+            result = run(clauses, num_vars, record, **options)
+            cache.put(key, *result)
+        return result
+    finally:
+        if record is not stats:
+            stats.update(record)
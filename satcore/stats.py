@@ -0,0 +1,36 @@
+"""Solver statistics shared by the engines: counters, phase timers and hooks."""
+
+
+class SolverStats(dict):
+    """
+    Counters by name. It is a dict, so benchmark rows read it with get() and
+    solvers may still set plain entries. Phase timers add up seconds under
+    "<phase>_time" ("propagation", "branching", "analysis", "resolution").
+
+    Callbacks registered with on() are called by the engines through emit():
+    "decision" (lit), "conflict" (clause index or None), "learn" (clause,
+    lbd), "restart" (), "eliminate" (var, clauses removed, clauses added) and
+    "resolvent" (clause).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hooks = {}
+
+    def count(self, name, amount=1):
+        self[name] = self.get(name, 0) + amount
+
+    def maximum(self, name, value):
+        if value > self.get(name, 0):
+            self[name] = value
+
+    def add_time(self, phase, seconds):
+        key = phase + "_time"
+        self[key] = self.get(key, 0.0) + seconds
+
+    def on(self, event, callback):
+        self.hooks.setdefault(event, []).append(callback)
+
+    def emit(self, event, *args):
+        for callback in self.hooks.get(event, ()):
+            callback(*args)
@@ -0,0 +1,86 @@
+"""Clause sets that keep themselves free of subsumed clauses."""
+from collections import defaultdict
+
+
+def signature(clause):
+    """64-bit literal signature: if a is a subset of b then signature(a) & ~signature(b) == 0."""
+    sig = 0
+    for lit in clause:
+        sig |= 1 << (lit % 64)
+    return sig
+
+
+class ClauseSet:
+    """
+    A set of frozenset clauses with a signature per clause and a
+    literal-to-clauses occurrence index. The initial clauses are stored as
+    given; add() drops a clause that an existing one subsumes and removes the
+    existing clauses the new one subsumes. The signatures rule out most
+    candidates before any set comparison is made.
+    """
+
+    def __init__(self, clauses=()):
+        self.signatures = {}
+        self.occurs = defaultdict(set)
+        for clause in clauses:
+            self.insert(frozenset(clause))
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def __iter__(self):
+        return iter(self.signatures)
+
+    def __contains__(self, clause):
+        return clause in self.signatures
+
+    def insert(self, clause):
+        """Stores a clause without any subsumption check."""
+        if clause not in self.signatures:
+            self.signatures[clause] = signature(clause)
+            for lit in clause:
+                self.occurs[lit].add(clause)
+
+    def remove(self, clause):
+        del self.signatures[clause]
+        for lit in clause:
+            self.occurs[lit].discard(clause)
+
+    def is_subsumed(self, clause, sig=None):
+        """Forward check: whether a stored clause is a subset of clause."""
+        if sig is None:
+            sig = signature(clause)
+        mask = ~sig
+        signatures = self.signatures
+        size = len(clause)
+        for lit in clause:
+            for other in self.occurs.get(lit, ()):
+                if not signatures[other] & mask and len(other) <= size and other <= clause:
+                    return True
+        return False
+
+    def remove_subsumed(self, clause, sig=None):
+        """Backward step: removes and returns the stored clauses that are proper supersets of clause."""
+        if not clause:
+            removed = list(self.signatures)
+        else:
+            if sig is None:
+                sig = signature(clause)
+            signatures = self.signatures
+            size = len(clause)
+            lit = min(clause, key=lambda lit: len(self.occurs.get(lit, ())))
+            removed = [other for other in self.occurs.get(lit, ())
+                       if not sig & ~signatures[other] and len(other) > size and clause <= other]
+        for other in removed:
+            self.remove(other)
+        return removed
+
+    def add(self, clause):
+        """Adds clause unless it is subsumed; returns whether it was added."""
+        clause = frozenset(clause)
+        sig = signature(clause)
+        if self.is_subsumed(clause, sig):
+            return False
+        self.remove_subsumed(clause, sig)
+        self.insert(clause)
+        return True